@@ -349,7 +349,9 @@ def with_timeout(timeout_seconds: int = config.COMMAND_TIMEOUT):
         @wraps(func)
         async def wrapper(ctx: commands.Context[BumKkiBot], *args, **kwargs):
             try:
-                return await asyncio.wait_for(func(ctx, *args, **kwargs), timeout=timeout_seconds)
+                # asyncio.timeout은 wait_for와 달리 별도 task를 만들지 않음 (py3.11+)
+                async with asyncio.timeout(timeout_seconds):
+                    return await func(ctx, *args, **kwargs)
             except asyncio.TimeoutError:
                 await ctx.send(f"⏰ 명령어 최대 시간({timeout_seconds}초) 초과로 취소되었어양")
         return wrapper
@@ -10,6 +10,7 @@ from __future__ import annotations
 from typing import Dict
 
 import httpx
+import orjson
 import requests
 from exceptions.base import UtilsBaseException
 
@@ -44,7 +45,7 @@ def nexon_api_error_handler(response: httpx.Response):
     status = response.status_code
     msg = None
     try:
-        payload = response.json()
+        payload = orjson.loads(response.content)
         error = payload.get("error") if isinstance(payload, dict) else None
         msg = (error or {}).get("message")
     except Exception:
@@ -9,23 +9,138 @@ import discord
 from discord.ext import commands
 from bot import BumKkiBot
 
+import asyncio
+import functools
 import random
+import threading
 import time
-from ddgs import DDGS
 
 from service.basic_utils import ImageViewer
 from service.basic_utils import check_ban, parse_user_list, parse_version_info
 from service.basic_utils import rcon_client, rcon_command_retry, rcon_command
 from common.text import strip_ansi_escape, parse_tps
-from config import COMMAND_TIMEOUT, BOT_COMMAND_PREFIX, MINECRAFT_RCON_PASSWORD, MINECRAFT_PUBLIC_DOMAIN
+from config import COMMAND_TIMEOUT, MINECRAFT_RCON_PASSWORD, MINECRAFT_PUBLIC_DOMAIN
 from bot_logger import log_command, with_timeout
 
-from ddgs.exceptions import DDGSException
 from exceptions.client_exceptions import RCON_CLIENT_ERROR
 from exceptions.command_exceptions import InvalidCommandFormat, CommandFailure
 
 from typing import Dict
 
+@functools.cache
+def _get_ddgs():
+    """ddgs 모듈 지연 import 함수 (최초 이미지 검색시 1회만 import)
+
+    Returns:
+        tuple: (DDGS 클래스, DDGSException 예외 클래스)
+    """
+    from ddgs import DDGS
+    from ddgs.exceptions import DDGSException
+    return DDGS, DDGSException
+
+
+def _delete_message_background(ctx: commands.Context[BumKkiBot]) -> None:
+    """명령어 메세지 삭제를 백그라운드로 실행하는 함수
+
+    삭제 확인 응답을 기다리지 않고 다음 전송을 바로 진행할 수 있게 함
+    (삭제 실패 안내 메세지는 백그라운드 태스크에서 전송)
+
+    Args:
+        ctx (commands.Context): 삭제할 메세지가 포함된 명령어 컨텍스트
+    """
+    async def _delete() -> None:
+        try:
+            await ctx.message.delete()
+        except discord.Forbidden:
+            await ctx.message.channel.send("메세지 삭제 권한이 없어양")
+        except discord.NotFound:
+            pass # 이미 삭제된 메세지
+        except discord.HTTPException:
+            await ctx.message.channel.send("메세지 삭제 중 오류가 발생했어양")
+        except Exception:
+            await ctx.message.channel.send("알 수 없는 오류가 발생했어양")
+
+    asyncio.create_task(_delete())
+
+
+# 블링크빵 전용 난수 생성기 (모듈 전역 random 인스턴스 공유 방지, 메서드 바인딩 1회)
+_rng_randrange = random.Random().randrange
+
+# DDGS API rate limit 대응용 최소 호출 간격 (직전 검색 후 2초 미만일 때만 대기)
+_DDGS_MIN_INTERVAL: float = 2.0
+_ddgs_last_call: float = 0.0
+_ddgs_lock = asyncio.Lock()
+
+
+async def _ddgs_rate_limit() -> None:
+    """이미지 검색 호출 간격을 비동기로 보장하는 함수 (이벤트 루프 비차단)"""
+    global _ddgs_last_call
+    async with _ddgs_lock:
+        delay = _DDGS_MIN_INTERVAL - (time.monotonic() - _ddgs_last_call)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        _ddgs_last_call = time.monotonic()
+
+
+# 동일 검색어 이미지 결과 TTL 캐시 (캐시 적중시 rate limit 대기 없이 즉시 응답)
+_IMAGE_CACHE_TTL: float = 300.0 # 초 단위
+_IMAGE_CACHE_MAXSIZE: int = 128
+_image_cache: Dict[tuple, tuple[float, list[tuple[str, str]]]] = {}
+
+
+def _image_cache_get(cache_key: tuple) -> list[tuple[str, str]] | None:
+    """이미지 검색 TTL 캐시 조회 함수 (만료된 항목은 제거 후 None 반환)"""
+    cached = _image_cache.get(cache_key)
+    if cached is None:
+        return None
+    expire_at, cached_results = cached
+    if time.monotonic() >= expire_at:
+        _image_cache.pop(cache_key, None)
+        return None
+    return cached_results
+
+
+def _image_cache_set(cache_key: tuple, results: list[tuple[str, str]]) -> None:
+    """이미지 검색 TTL 캐시 저장 함수 (최대 크기 초과시 전체 비움)"""
+    if len(_image_cache) >= _IMAGE_CACHE_MAXSIZE:
+        _image_cache.clear()
+    _image_cache[cache_key] = (time.monotonic() + _IMAGE_CACHE_TTL, results)
+
+
+# 공유 DDGS 클라이언트 (호출마다 새 세션/TLS 핸드셰이크 생성 방지)
+_ddgs_client = None
+_ddgs_client_lock = threading.Lock() # 워커 스레드에서 생성되므로 threading.Lock 사용
+
+
+def _get_ddgs_client():
+    """공유 DDGS 클라이언트 조회 함수 (최초 호출시 1회 생성)"""
+    global _ddgs_client
+    if _ddgs_client is None:
+        with _ddgs_client_lock:
+            if _ddgs_client is None:
+                DDGS, _ = _get_ddgs()
+                _ddgs_client = DDGS()
+    return _ddgs_client
+
+
+def _ddgs_image_search(keyword: str, region: str = "ja-jp") -> list[dict]:
+    """DDGS 이미지 검색 동기 호출 함수 (asyncio.to_thread로 실행)
+
+    Args:
+        keyword (str): 이미지 검색어
+        region (str, optional): 검색 지역 코드. Defaults to "ja-jp".
+
+    Returns:
+        list[dict]: 이미지 검색 결과 목록
+    """
+    return _get_ddgs_client().images(
+        query=keyword,
+        safesearch="off",
+        region=region,
+        num_results=10,
+    )
+
+
 # 샴 따라해 기능 복원
 @with_timeout(COMMAND_TIMEOUT)
 @log_command(alt_func_name="븜 따라해")
@@ -39,31 +154,15 @@ async def msg_handle_repeat(ctx: commands.Context[BumKkiBot], repeat_text: str)
     Raises:
         Exception: 메세지 삭제 권한이 없거나, 메세지 삭제 실패시 발생
     """
-    content_raw: str = ctx.message.content
+    # 명령어 prefix 검사는 commands 확장이 디스패치 단계에서 이미 수행함
+    output = repeat_text.strip()
 
-    if content_raw.startswith(f"{BOT_COMMAND_PREFIX}따라해"):
-        output = repeat_text.strip()
-        try:
-            await ctx.message.delete()
+    # 삭제 확인을 기다리지 않고 바로 응답 (삭제는 백그라운드에서 진행)
+    _delete_message_background(ctx)
 
-        except discord.Forbidden:
-            await ctx.message.channel.send("메세지 삭제 권한이 없어양")
-            raise CommandFailure("Forbidden access to delete message")
-        
-        except discord.HTTPException:
-            await ctx.message.channel.send("메세지 삭제 중 오류가 발생했어양")
-            raise CommandFailure("HTTP error while deleting message")
-
-        except Exception:
-            await ctx.message.channel.send("알 수 없는 오류가 발생했어양")
-            raise CommandFailure("Unknown error while deleting message")
-        
-        if output:
-            await ctx.message.channel.send(output)
-            return
-    
-    else:
-        return
+    if output:
+        await ctx.message.channel.send(output)
+    return
 
 
 # 샴 이미지 기능 복원
@@ -102,40 +201,60 @@ async def msg_handle_image(ctx: commands.Context[BumKkiBot], search_term: str |
             await ctx.send(file=dnf_file, reference=ctx.message)
         return
 
-    results: list[dict] | None = None
-    with DDGS() as ddgs:
-        try:
-            time.sleep(2) # API rate limit 
-            results = ddgs.images(
-                query=image_search_keyword,
-                safesearch="off",
-                region="ja-jp",
-                num_results=20,
-            )
-        except DDGSException as e:
-            await ctx.message.channel.send(f"이미지 검색 사이트에 오류가 발생했어양...")
-            raise CommandFailure(f"DDGS API error: {str(e)}")
-        except Exception as e:
+    # 대소문자만 다른 검색어도 같은 캐시 항목 사용
+    cache_key = (image_search_keyword.lower(), "ja-jp")
+    image_results = _image_cache_get(cache_key)
+    if image_results is None:
+        _, DDGSException = _get_ddgs()
+        await _ddgs_rate_limit() # API rate limit (이벤트 루프 비차단, 캐시 적중시 생략)
+
+        # 두 지역 검색을 동시 실행 (한쪽 실패/결과 부족 대비, 체감시간은 max(t1, t2))
+        region_results = await asyncio.gather(
+            asyncio.to_thread(_ddgs_image_search, image_search_keyword, "ja-jp"),
+            asyncio.to_thread(_ddgs_image_search, image_search_keyword, "wt-wt"),
+            return_exceptions=True,
+        )
+        errors = [r for r in region_results if isinstance(r, BaseException)]
+        if len(errors) == len(region_results):
+            # 모든 지역 검색 실패시에만 오류 처리
+            first_error = errors[0]
+            if isinstance(first_error, DDGSException):
+                await ctx.message.channel.send(f"이미지 검색 사이트에 오류가 발생했어양...")
+                raise CommandFailure(f"DDGS API error: {str(first_error)}")
             await ctx.message.channel.send(f"검색 중에 오류가 발생했어양...")
-            raise CommandFailure(f"Unknown error: {str(e)}")
-    
-    if not results:
-        await ctx.message.channel.send("이미지를 찾을 수 없어양!!")
-        return
-    else:
-        images = [r for r in results if "image" in r and "url" in r]
+            raise CommandFailure(f"Unknown error: {str(first_error)}")
+
+        # 지역별 결과 병합 + image URL 기준 중복 제거 (유효한 결과 10개가 모이면 중단)
+        image_results = []
+        seen_image_urls: set[str] = set()
+        for results in region_results:
+            if isinstance(results, BaseException) or not results:
+                continue
+            for result in results:
+                if "image" not in result or "url" not in result:
+                    continue
+                if result["image"] in seen_image_urls:
+                    continue
+                seen_image_urls.add(result["image"])
+                # 필요한 두 URL만 튜플로 평탄화 (뷰어에서 dict 키 조회 제거)
+                image_results.append((result["image"], result["url"]))
+                if len(image_results) == 10:
+                    break
+            if len(image_results) == 10:
+                break
+
+        if not image_results:
+            await ctx.message.channel.send("이미지를 찾을 수 없어양!!")
+            return
+
+        # 필터링 완료된 결과만 저장 (캐시 적중시 재필터링 불필요)
+        _image_cache_set(cache_key, image_results)
 
-    image_results = images[0:10]  # 최대 10개 이미지
     view_owner: discord.User = ctx.message.author
     view = ImageViewer(images=image_results, search_keyword=image_search_keyword, requester=view_owner)
-    index_indicator: str = f"{view.current_index + 1}/{len(view.images)}"
 
-    embed = discord.Embed(title=f"'{image_search_keyword}' 이미지 검색 결과 에양 ({index_indicator})")
-    embed.set_image(url=view.images[view.current_index]["image"])
-    embed.description = f"[🔗 원본 보기]({view.images[view.current_index]['url']})"
-    embed.set_footer(text="문제가 있는 이미지면 관리자 권한으로 삭제할 수 있어양!")
-
-    sent_message = await ctx.message.channel.send(embed=embed, view=view)
+    # 첫 페이지 embed는 View 생성시 이미 만들어져 있음
+    sent_message = await ctx.message.channel.send(embed=view.embeds[0], view=view)
     view.message = sent_message
 
 
@@ -152,22 +271,18 @@ async def msg_handle_blinkbang(ctx: commands.Context[BumKkiBot]):
     Raises:
         Exception: 메세지 삭제 권한이 없거나, 메세지 삭제 실패시 발생
     """
-    command_prefix: str = "븜 블링크빵"
-
     if ctx.message.author.bot:
         return
 
-    if ctx.message.content.startswith(command_prefix):
-        mention = ctx.message.author.mention
-        result: int = random.randint(0, 100)
-        try:
-            await ctx.message.delete()
-        except discord.Forbidden:
-            await ctx.message.channel.send("메세지 삭제 권한이 없어양")
-            raise CommandFailure("Forbidden access to delete message")
+    # 명령어 prefix 검사는 commands 확장이 디스패치 단계에서 이미 수행함
+    mention = ctx.message.author.mention
+    result: int = _rng_randrange(101) # 0~100
 
-        await ctx.message.channel.send(f"{mention}님의 블링크빵 결과: {result}미터 만큼 날아갔어양! 💨💨💨")
-        return
+    # 삭제 확인을 기다리지 않고 바로 응답 (삭제는 백그라운드에서 진행)
+    _delete_message_background(ctx)
+
+    await ctx.message.channel.send(f"{mention}님의 블링크빵 결과: {result}미터 만큼 날아갔어양! 💨💨💨")
+    return
 
 
 # 마크 서버 명령어: 서버 정보 조회
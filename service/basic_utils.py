@@ -1,6 +1,7 @@
 import os
 import discord
 import asyncio
+import aiohttp
 from discord.ui import View, Button
 
 from dotenv import load_dotenv
@@ -11,23 +12,29 @@ from contextlib import contextmanager
 from typing import Generator
 
 from exceptions.client_exceptions import RCON_CLIENT_ERROR
+from bot_logger import logger
 
 # 샴 이미지 이미지 뷰어 클래스 정의
 class ImageViewer(View):
-    def __init__(self, images: list[dict], search_keyword: str, requester: discord.User, timeout: int = 600):
+    def __init__(self, images: list[tuple[str, str]], search_keyword: str, requester: discord.User, timeout: int = 600):
         super().__init__(timeout=timeout)
         self.images = images
         self.image_search_keyword = search_keyword
         self.current_index = 0
         self.view_owner: discord.User = requester
         self.message = None
+        self._prefetched: set[int] = set()
+        self._session: aiohttp.ClientSession | None = None
 
-        # 버튼 추가
-        self.add_item(Button(label="⏮️", style=discord.ButtonStyle.secondary, custom_id="first"))
-        self.add_item(Button(label="◀️", style=discord.ButtonStyle.secondary, custom_id="prev"))
-        self.add_item(Button(label="▶️", style=discord.ButtonStyle.secondary, custom_id="next"))
-        self.add_item(Button(label="⏭️", style=discord.ButtonStyle.secondary, custom_id="last"))
-        self.add_item(Button(label="❌", style=discord.ButtonStyle.primary, custom_id="delete"))
+        # 페이지별 embed를 한 번만 생성 (버튼 클릭시 재구성 방지)
+        total = len(images)
+        self.embeds: list[discord.Embed] = []
+        for i, (image_url, source_url) in enumerate(images):
+            embed = discord.Embed(title=f"'{search_keyword}' 이미지 검색 결과 에양 ({i + 1}/{total})")
+            embed.set_image(url=image_url)
+            embed.description = f"[🔗 원본 보기]({source_url})"
+            embed.set_footer(text="문제가 있는 이미지면 관리자 권한으로 삭제할 수 있어양!")
+            self.embeds.append(embed)
 
 
     def is_owner(self, interaction: discord.Interaction) -> bool:
@@ -67,49 +74,103 @@ class ImageViewer(View):
             return
 
 
-    async def interaction_check(self, interaction: discord.Interaction) -> bool:               
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        # 권한 검사만 수행, 페이지 이동은 버튼 콜백에서 처리
         action = interaction.data["custom_id"]
 
         if not self.has_permission(interaction, action):
             await self._send_no_permission_message(interaction, action)
             return False
-        
-        if action == "first":
-            self.current_index = 0
-        elif action == "prev":
-            self.current_index = max(0, self.current_index - 1)
-        elif action == "next":
-            self.current_index = min(len(self.images) - 1, self.current_index + 1)
-        elif action == "last":
-            self.current_index = len(self.images) - 1
-        elif action == "delete":
-            if not interaction.response.is_done():
-                await interaction.response.defer(ephemeral=True)
-            if self.message:
-                try:
-                    await self.message.delete()
-                except discord.NotFound:
-                    pass
-            self.stop()
-            return False  # View 종료
 
-        await self.update_msg(interaction)
         return True
 
 
-    async def update_msg(self, interaction: discord.Interaction):
-        index = f"{self.current_index + 1}/{len(self.images)}"
-        embed = discord.Embed(title=f"'{self.image_search_keyword}' 이미지 검색 결과 에양 ({index})")
-        embed.set_image(url=self.images[self.current_index]["image"])
-        embed.description = f"[🔗 원본 보기]({self.images[self.current_index]['url']})"
-        embed.set_footer(text="문제가 있는 이미지면 관리자 권한으로 삭제할 수 있어양!")
-
-        if interaction.response.is_done():
-            await interaction.followup.edit_message(message_id=self.message.id, embed=embed, view=self)
+    async def _goto_page(self, interaction: discord.Interaction, new_index: int) -> None:
+        """페이지 이동 공통 처리 함수
+
+        경계(첫/마지막 페이지)에서 인덱스가 그대로면 메세지 편집 REST 호출을
+        생략하고 응답만 소비해서 rate limit을 아낀다.
+        """
+        if new_index == self.current_index:
+            await interaction.response.defer() # 변경 없음
             return
-        else:
-            await interaction.response.edit_message(embed=embed, view=self)
+        self.current_index = new_index
+        await self.update_msg(interaction)
+
+
+    # 버튼 정의: 클래스 선언 시점에 1회 등록 (인스턴스별 add_item 반복 제거)
+    @discord.ui.button(label="⏮️", style=discord.ButtonStyle.secondary, custom_id="first")
+    async def first_button(self, button: Button, interaction: discord.Interaction):
+        await self._goto_page(interaction, 0)
+
+
+    @discord.ui.button(label="◀️", style=discord.ButtonStyle.secondary, custom_id="prev")
+    async def prev_button(self, button: Button, interaction: discord.Interaction):
+        await self._goto_page(interaction, max(0, self.current_index - 1))
+
+
+    @discord.ui.button(label="▶️", style=discord.ButtonStyle.secondary, custom_id="next")
+    async def next_button(self, button: Button, interaction: discord.Interaction):
+        await self._goto_page(interaction, min(len(self.images) - 1, self.current_index + 1))
+
+
+    @discord.ui.button(label="⏭️", style=discord.ButtonStyle.secondary, custom_id="last")
+    async def last_button(self, button: Button, interaction: discord.Interaction):
+        await self._goto_page(interaction, len(self.images) - 1)
+
+
+    @discord.ui.button(label="❌", style=discord.ButtonStyle.primary, custom_id="delete")
+    async def delete_button(self, button: Button, interaction: discord.Interaction):
+        if not interaction.response.is_done():
+            await interaction.response.defer(ephemeral=True)
+        if self.message:
+            try:
+                await self.message.delete()
+            except discord.NotFound:
+                pass
+        await self._close_session()
+        self.stop()
+
+
+    async def update_msg(self, interaction: discord.Interaction):
+        embed = self.embeds[self.current_index]
+
+        # 페이지 이동 콜백 전에는 response를 소비하지 않으므로 edit_message로 바로 응답
+        await interaction.response.edit_message(embed=embed, view=self)
+
+        # 다음/이전 이미지 미리 받아두기 (클릭시 CDN 대기시간 숨김)
+        asyncio.create_task(self._prefetch(self.current_index + 1))
+        asyncio.create_task(self._prefetch(self.current_index - 1))
+        return
+
+
+    async def _prefetch(self, index: int) -> None:
+        """인접 이미지 URL을 백그라운드로 요청해서 CDN 캐시를 덥히는 함수
+
+        Args:
+            index (int): 미리 받아둘 이미지 인덱스 (범위 밖이면 무시)
+        """
+        if not (0 <= index < len(self.images)) or index in self._prefetched:
             return
+        self._prefetched.add(index)
+
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession()
+        try:
+            async with self._session.head(
+                self.images[index][0], # 이미지 URL
+                timeout=aiohttp.ClientTimeout(total=5),
+                allow_redirects=True,
+            ):
+                pass
+        except Exception:
+            pass # 프리페치 실패는 무시 (클릭시 기존 경로로 로드됨)
+
+
+    async def _close_session(self) -> None:
+        """프리페치용 세션 정리 함수 (View 종료/타임아웃시 호출)"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
 
     # 10분 후 타임아웃 처리
     async def on_timeout(self):
@@ -122,7 +183,10 @@ class ImageViewer(View):
             try:
                 await self.message.edit(view=self)
             except discord.NotFound:
-                pass
+                logger.debug("ImageViewer message already deleted on timeout")
+
+        await self._close_session()
+        self.stop() # 타임아웃 future 즉시 해제
             
             
 def check_ban(image_search_keyword: str) -> bool:
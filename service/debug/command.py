@@ -26,6 +26,263 @@ bot_developer_id: int = config.BOT_DEVELOPER_ID
 bot_version: str = config.BOT_VERSION
 
 
+def _build_help_embeds() -> Dict[str | None, discord.Embed]:
+    """도움말 embed 템플릿을 카테고리별로 생성하는 함수 (import 시점에 1회 실행)
+
+    도움말 내용은 전부 정적이므로 매 호출마다 add_field를 반복하지 않고
+    템플릿을 복사해서 description/footer만 요청별로 채운다.
+
+    Returns:
+        Dict[str | None, discord.Embed]: 카테고리(Key) : embed 템플릿(Value)
+    """
+    embeds: Dict[str | None, discord.Embed] = {}
+
+    # 카테고리 없음 -> 카테고리 목록 표시
+    embed = discord.Embed(
+        title=f"븜끼봇 명령어 카테고리 목록 (븜 명령어 <카테고리>)",
+        color=discord.Color.blue()
+    )
+    embed.add_field(
+        name="메이플",
+        value="메이플스토리 관련 명령어 모음이에양!\n",
+        inline=False
+    )
+    embed.add_field(
+        name="던파",
+        value="던전앤파이터 관련 명령어 모음이에양!\n",
+        inline=False
+    )
+    embed.add_field(
+        name="기타",
+        value="기타 여러가지 명령어 모음이에양! (주식, 날씨 등)\n",
+        inline=False
+    )
+    embed.add_field(
+        name="관리자",
+        value="관리자 전용 명령어 모음이에양! (서버 관리자만 사용 가능)\n",
+        inline=False
+    )
+    embeds[None] = embed
+
+    # 메이플 카테고리 도움말
+    embed = discord.Embed(
+        title=f"븜끼봇 명령어 - 메이플스토리",
+        color=discord.Color.blue()
+    )
+    embed.add_field(
+        name="븜 기본정보 <캐릭터 이름>",
+        value="메이플스토리 캐릭터의 기본 정보를 조회합니다.\n ",
+        inline=False
+    )
+    embed.add_field(
+        name="븜 상세정보 <캐릭터 이름>",
+        value="메이플스토리 캐릭터의 상세 정보를 조회합니다.\n*기본 정보보다 더 많은 정보를 제공해양*\n ",
+        inline=False
+    )
+    embed.add_field(
+        name="븜 어빌리티 <캐릭터 이름>",
+        value="메이플스토리 캐릭터의 어빌리티 정보를 조회합니다.\n*사용중인 어빌리티와 프리셋 정보를 제공해양*\n ",
+        inline=False
+    )
+    embed.add_field(
+        name="븜 운세 <캐릭터 이름>",
+        value="오늘의 메이플스토리 캐릭터 운세를 조회합니다.\n*재미로만 봐주세양!!*\n*참고) 5성:5%, 4성:20%, 3성:30%, 2성:40%, 1성:5% 확률로 나와양*\n ",
+        inline=False
+    )
+    embed.add_field(
+        name="븜 경험치 <캐릭터 이름>",
+        value="메이플스토리 캐릭터의 경험치 그래프를 조회합니다.\n*최근 7일간 경험치 변화를 그래프로 보여줘양*\n ",
+        inline=False
+    )
+    embed.add_field(
+        name="븜 경험치v1 <캐릭터 이름>",
+        value="메이플스토리 캐릭터의 경험치 그래프를 조회합니다. (구버전)\n*최근 7일간 경험치 변화를 그래프로 보여줘양*\n ",
+        inline=False
+    )
+    embed.add_field(
+        name="븜 코디 <캐릭터 이름>",
+        value="메이플스토리 캐릭터의 코디(외형) 정보를 조회합니다.\n*캐릭터가 착용중인 코디 아이템을 보여줘양*\n ",
+        inline=False
+    )
+    embed.add_field(
+        name="븜 컬렉션 <캐릭터 이름>",
+        value="메이플스토리 캐릭터의 컬렉션 정보를 조회합니다.\n*최대 8개의 컬렉션을 보여줘양*\n ",
+        inline=False
+    )
+    embed.add_field(
+        name="븜 피씨방",
+        value="최근 피씨방 공지사항을 조회합니다.\n*이미지가 길쭉해서 좀 오래걸려양*\n ",
+        inline=False
+    )
+    embed.add_field(
+        name="븜 썬데이",
+        value="썬데이 메이플 공지사항을 조회합니다.\n*매주 금요일 오전에 업데이트돼양*\n ",
+        inline=False
+    )
+    embeds["메이플"] = embed
+
+    # 던파 카테고리 도움말
+    embed = discord.Embed(
+        title=f"븜끼봇 명령어 - 던전앤파이터",
+        color=discord.Color.blue()
+    )
+    embed.add_field(
+        name="븜 던파정보 <서버이름> <캐릭터이름>",
+        value="던전앤파이터 캐릭터의 정보를 조회합니다.\n*한글로 서버 이름과 캐릭터 이름을 입력해양*\n*예시) 븜 던파정보 카인 마법사악*\n ",
+        inline=False
+    )
+    embed.add_field(
+        name="븜 주간던파 <서버이름> <캐릭터이름>",
+        value="던전앤파이터 캐릭터의 주간 던파를 요약합니다.\n*레이드 클리어 기록, 태초획득 기록까지 븜미가 친절히 알려줘양*\n ",
+        inline=False
+    )
+    embed.add_field(
+        name="븜 던파장비 <서버이름> <캐릭터이름>",
+        value="던전앤파이터 캐릭터의 장비 정보를 조회합니다.\n*장비 아이템명, 등급, 강화수치, 세트포인트 등을 보여줘양*\n ",
+        inline=False
+    )
+    embeds["던파"] = embed
+
+    # 기타 카테고리 도움말
+    embed = discord.Embed(
+        title=f"븜끼봇 명령어 - 기타 (날씨, 주식 등)",
+        color=discord.Color.blue()
+    )
+    embed.add_field(
+        name="븜 이미지 <검색어>",
+        value="이미지를 검색해서 최대 10개의 이미지를 보여줍니다.\n(사용하는 검색엔진: https://duckduckgo.com/)\n***참고로, 야한건... 안돼양!!!***\n ",
+        inline=False
+    )
+    embed.add_field(
+        name="븜 따라해 <메세지>",
+        value="입력한 메세지를 그대로 따라합니다. \n*마크다운을 지원해양*\n ",
+        inline=False
+    )
+    embed.add_field(
+        name="븜 날씨 <지역명 혹은 주소> (v3 개발중)",
+        value="**[카카오 / 기상청 API]**\n 현재 날씨와 예보정보를 조회합니다. \n*주소를 입력하면 더 정확하게 나와양\n대신 누군가 찾아올수도...*\n",
+        inline=False
+    )
+    embed.add_field(
+        name="븜 블링크빵",
+        value="랜덤한 자연수 1~100 랜덤 추출합니다. \n*결과는 날아간 거리로 보여줘양*\n ",
+        inline=False
+    )
+    embed.add_field(
+        name="븜 미국주식 <티커>",
+        value="미국 주식의 현재 가격을 조회합니다.\n*참고) 티커: BRK.B -> BRK-B* ",
+        inline=False
+    )
+    embed.add_field(
+        name="븜 미국차트 <티커> <기간>",
+        value="미국 주식의 가격 차트를 조회합니다.\n기간 옵션: 1주, 1개월, 3개월, 6개월, 1년, 5년, 최대\n*참고) 티커: BRK.B -> BRK-B* ",
+        inline=False
+    )
+    embed.add_field(
+        name="븜 한국주식 <종목명 또는 종목코드>",
+        value="한국 주식의 현재 가격을 조회합니다.\n*종목명이나 종목코드를 입력해양* ",
+        inline=False
+    )
+    embed.add_field(
+        name="븜 한국차트 <종목명 또는 종목코드> <기간>",
+        value="한국 주식의 가격 차트를 조회합니다.\n기간 옵션: 1주, 1개월, 3개월, 6개월, 1년, 5년, 최대\n*종목명이나 종목코드를 입력해양* ",
+        inline=False
+    )
+    embed.add_field(
+        name="븜 명령어통계",
+        value="서버 내에서 가장 오래/빨리 실행된 명령어와 순위를 집계합니다.\n*DB에 연결되어 있어야해양!*\n ",
+        inline=False
+    )
+    embed.add_field(
+        name="븜 사용자통계",
+        value="서버 내에서 가장 많이 명령어를 호출한 사용자 통계를 조회합니다.\n*DB에 연결되어 있어야해양!*\n ",
+        inline=False
+    )
+    embeds["기타"] = embed
+
+    # 관리자 전용 명령어 DM 안내
+    embed = discord.Embed(
+        title=f"븜끼봇 명령어 - 관리자 전용 (븜 디버그)",
+        description="서버 관리자를 위한 관리자 전용 명령어 목록이에양!\n",
+        color=discord.Color.blue()
+    )
+    embed.add_field(
+        name="븜 디버그 info",
+        value="봇의 현재 상태 및 가동 시간 표시\n",
+        inline=False
+    )
+    embed.add_field(
+        name="븜 디버그 mem",
+        value="봇의 현재 메모리 사용량 표시\n",
+        inline=False
+    )
+    embed.add_field(
+        name="븜 디버그 switch",
+        value="봇 디버그 모드 전환 (에러로그가 상세하게 표시됩니다. 기본: OFF)\n",
+        inline=False
+    )
+    embed.add_field(
+        name="븜 디버그 stats",
+        value="상위 10개 가장 많이 실행된 명령어와 수행시간 조회\n",
+        inline=False
+    )
+    embed.add_field(
+        name="븜 디버그 userstats",
+        value="상위 3명 가장 많이 명령어를 호출한 사용자의 통계 조회\n**사용자 멘션 포함 주의!**\n",
+        inline=False
+    )
+    embed.add_field(
+        name="븜 디버그 resetstats",
+        value="봇의 사용자 및 명령어 통계 초기화\n *봇 재시작시 자동 초기화, 메모리 사용량이 높으면 사용*\n",
+        inline=False
+    )
+    embeds["관리자_DM"] = embed
+
+    return embeds
+
+
+# 도움말 embed 템플릿 (정적 내용이므로 1회만 dict로 변환, 호출시 from_dict 한 번으로 생성)
+_HELP_EMBED_DICTS: Dict[str | None, dict] = {
+    help_category: help_embed.to_dict()
+    for help_category, help_embed in _build_help_embeds().items()
+}
+
+# 카테고리별 description 말미에 붙는 API 출처 표기
+_HELP_DESC_SUFFIX: Dict[str, str] = {
+    "메이플": "**[넥슨 Open API 기반]**",
+    "던파": "**[네오플 Open API 기반]**",
+}
+
+# 서버(guild)별 도움말 푸터 캐시 (서버별 봇 표시 이름만 다르고 나머지는 고정)
+_HELP_FOOTER_CACHE: Dict[int, str] = {}
+
+
+def _help_footer(ctx: commands.Context[BumKkiBot]) -> str:
+    """도움말 embed 공통 푸터 생성 함수 (guild 단위 캐시)
+
+    Args:
+        ctx (commands.Context): Discord 명령어 컨텍스트
+
+    Returns:
+        str: 도움말 공통 푸터 문자열
+    """
+    guild_id: int = ctx.guild.id
+    footer = _HELP_FOOTER_CACHE.get(guild_id)
+    if footer is None:
+        footer = (
+            "------\n"
+            f"봇 이름: {ctx.guild.me.name}\n"
+            f"봇 버전: {bot_version}\n"
+            f"소스코드: https://github.com/yhbird/study-discord\n"
+            "------\n"
+            "Data based on NEXON Open API\n"
+            "Powered by Neople Open API\n"
+            "주식 데이터 Yahoo Finance 제공\n"
+        )
+        _HELP_FOOTER_CACHE[guild_id] = footer
+    return footer
+
+
 # 메모리 사용량 조회
 @with_timeout(command_timeout)
 @log_command(stats=False, alt_func_name="봇 메모리 사용량 조회")
@@ -167,170 +424,11 @@ async def deb_help(ctx: commands.Context[BumKkiBot], category: str = None):
         f"{description_prefix}"
     )
     
-    if category is None:
-        # 카테고리 없음 -> 카테고리 목록 표시
-        embed = discord.Embed(
-            title=f"븜끼봇 명령어 카테고리 목록 (븜 명령어 <카테고리>)",
-            description=description_text,
-            color=discord.Color.blue()
-        )
-        embed.add_field(
-            name="메이플",
-            value="메이플스토리 관련 명령어 모음이에양!\n",
-            inline=False
-        )
-        embed.add_field(
-            name="던파",
-            value="던전앤파이터 관련 명령어 모음이에양!\n",
-            inline=False
-        )
-        embed.add_field(
-            name="기타",
-            value="기타 여러가지 명령어 모음이에양! (주식, 날씨 등)\n",
-            inline=False
-        )
-        embed.add_field(
-            name="관리자",
-            value="관리자 전용 명령어 모음이에양! (서버 관리자만 사용 가능)\n",
-            inline=False
-        )
-    elif category == "메이플":
-        # 메이플 카테고리 도움말
-        embed = discord.Embed(
-            title=f"븜끼봇 명령어 - 메이플스토리",
-            description=f"{description_text}**[넥슨 Open API 기반]**",
-            color=discord.Color.blue()
-        )
-        embed.add_field(
-            name="븜 기본정보 <캐릭터 이름>",
-            value="메이플스토리 캐릭터의 기본 정보를 조회합니다.\n ",
-            inline=False
-        )
-        embed.add_field(
-            name="븜 상세정보 <캐릭터 이름>",
-            value="메이플스토리 캐릭터의 상세 정보를 조회합니다.\n*기본 정보보다 더 많은 정보를 제공해양*\n ",
-            inline=False
-        )
-        embed.add_field(
-            name="븜 어빌리티 <캐릭터 이름>",
-            value="메이플스토리 캐릭터의 어빌리티 정보를 조회합니다.\n*사용중인 어빌리티와 프리셋 정보를 제공해양*\n ",
-            inline=False
-        )
-        embed.add_field(
-            name="븜 운세 <캐릭터 이름>",
-            value="오늘의 메이플스토리 캐릭터 운세를 조회합니다.\n*재미로만 봐주세양!!*\n*참고) 5성:5%, 4성:20%, 3성:30%, 2성:40%, 1성:5% 확률로 나와양*\n ",
-            inline=False
-        )
-        embed.add_field(
-            name="븜 경험치 <캐릭터 이름>",
-            value="메이플스토리 캐릭터의 경험치 그래프를 조회합니다.\n*최근 7일간 경험치 변화를 그래프로 보여줘양*\n ",
-            inline=False
-        )
-        embed.add_field(
-            name="븜 경험치v1 <캐릭터 이름>",
-            value="메이플스토리 캐릭터의 경험치 그래프를 조회합니다. (구버전)\n*최근 7일간 경험치 변화를 그래프로 보여줘양*\n ",
-            inline=False
-        )
-        embed.add_field(
-            name="븜 코디 <캐릭터 이름>",
-            value="메이플스토리 캐릭터의 코디(외형) 정보를 조회합니다.\n*캐릭터가 착용중인 코디 아이템을 보여줘양*\n ",
-            inline=False
-        )
-        embed.add_field(
-            name="븜 컬렉션 <캐릭터 이름>",
-            value="메이플스토리 캐릭터의 컬렉션 정보를 조회합니다.\n*최대 8개의 컬렉션을 보여줘양*\n ",
-            inline=False
-        )
-        embed.add_field(
-            name="븜 피씨방",
-            value="최근 피씨방 공지사항을 조회합니다.\n*이미지가 길쭉해서 좀 오래걸려양*\n ",
-            inline=False
-        )
-        embed.add_field(
-            name="븜 썬데이",
-            value="썬데이 메이플 공지사항을 조회합니다.\n*매주 금요일 오전에 업데이트돼양*\n ",
-            inline=False
-        )
-    elif category == "던파":
-        # 던파 카테고리 도움말
-        embed = discord.Embed(
-            title=f"븜끼봇 명령어 - 던전앤파이터",
-            description=f"{description_text}**[네오플 Open API 기반]**",
-            color=discord.Color.blue()
-        )
-        embed.add_field(
-            name="븜 던파정보 <서버이름> <캐릭터이름>",
-            value="던전앤파이터 캐릭터의 정보를 조회합니다.\n*한글로 서버 이름과 캐릭터 이름을 입력해양*\n*예시) 븜 던파정보 카인 마법사악*\n ",
-            inline=False
-        )
-        embed.add_field(
-            name="븜 주간던파 <서버이름> <캐릭터이름>",
-            value="던전앤파이터 캐릭터의 주간 던파를 요약합니다.\n*레이드 클리어 기록, 태초획득 기록까지 븜미가 친절히 알려줘양*\n ",
-            inline=False
-        )
-        embed.add_field(
-            name="븜 던파장비 <서버이름> <캐릭터이름>",
-            value="던전앤파이터 캐릭터의 장비 정보를 조회합니다.\n*장비 아이템명, 등급, 강화수치, 세트포인트 등을 보여줘양*\n ",
-            inline=False
-        )
-    elif category == "기타":
-        # 기타 카테고리 도움말
-        embed = discord.Embed(
-            title=f"븜끼봇 명령어 - 기타 (날씨, 주식 등)",
-            description=description_text,
-            color=discord.Color.blue()
-        )
-        embed.add_field(
-            name="븜 이미지 <검색어>",
-            value="이미지를 검색해서 최대 10개의 이미지를 보여줍니다.\n(사용하는 검색엔진: https://duckduckgo.com/)\n***참고로, 야한건... 안돼양!!!***\n ",
-            inline=False
-        )
-        embed.add_field(
-            name="븜 따라해 <메세지>",
-            value="입력한 메세지를 그대로 따라합니다. \n*마크다운을 지원해양*\n ",
-            inline=False
-        )
-        embed.add_field(
-            name="븜 날씨 <지역명 혹은 주소> (v3 개발중)",
-            value="**[카카오 / 기상청 API]**\n 현재 날씨와 예보정보를 조회합니다. \n*주소를 입력하면 더 정확하게 나와양\n대신 누군가 찾아올수도...*\n",
-            inline=False
-        )
-        embed.add_field(
-            name="븜 블링크빵",
-            value="랜덤한 자연수 1~100 랜덤 추출합니다. \n*결과는 날아간 거리로 보여줘양*\n ",
-            inline=False
-        )
-        embed.add_field(
-            name="븜 미국주식 <티커>",
-            value="미국 주식의 현재 가격을 조회합니다.\n*참고) 티커: BRK.B -> BRK-B* ",
-            inline=False
-        )
-        embed.add_field(
-            name="븜 미국차트 <티커> <기간>",
-            value="미국 주식의 가격 차트를 조회합니다.\n기간 옵션: 1주, 1개월, 3개월, 6개월, 1년, 5년, 최대\n*참고) 티커: BRK.B -> BRK-B* ",
-            inline=False
-        )
-        embed.add_field(
-            name="븜 한국주식 <종목명 또는 종목코드>",
-            value="한국 주식의 현재 가격을 조회합니다.\n*종목명이나 종목코드를 입력해양* ",
-            inline=False
-        )
-        embed.add_field(
-            name="븜 한국차트 <종목명 또는 종목코드> <기간>",
-            value="한국 주식의 가격 차트를 조회합니다.\n기간 옵션: 1주, 1개월, 3개월, 6개월, 1년, 5년, 최대\n*종목명이나 종목코드를 입력해양* ",
-            inline=False
-        )
-        embed.add_field(
-            name="븜 명령어통계",
-            value="서버 내에서 가장 오래/빨리 실행된 명령어와 순위를 집계합니다.\n*DB에 연결되어 있어야해양!*\n ",
-            inline=False
-        )
-        embed.add_field(
-            name="븜 사용자통계",
-            value="서버 내에서 가장 많이 명령어를 호출한 사용자 통계를 조회합니다.\n*DB에 연결되어 있어야해양!*\n ",
-            inline=False
-        )
-    elif category == "관리자":
+    if category != "관리자":
+        # 카테고리 없음/일반 카테고리 -> 템플릿 dict로 embed 생성 후 description만 채움
+        embed = discord.Embed.from_dict(_HELP_EMBED_DICTS[category])
+        embed.description = f"{description_text}{_HELP_DESC_SUFFIX.get(category, '')}"
+    else:
         is_admin: bool = False
         # 명령어 요청자 권한 확인
         if ctx.message.author.guild_permissions.administrator or ctx.message.author.id == bot_developer_id:
@@ -341,41 +439,7 @@ async def deb_help(ctx: commands.Context[BumKkiBot], category: str = None):
                 description="DM으로 명령어 목록을 보내드릴게양!",
                 color=discord.Color.green()
             )
-            dm_embed = discord.Embed(
-                title=f"븜끼봇 명령어 - 관리자 전용 (븜 디버그)",
-                description="서버 관리자를 위한 관리자 전용 명령어 목록이에양!\n",
-                color=discord.Color.blue()
-            )
-            dm_embed.add_field(
-                name="븜 디버그 info",
-                value="봇의 현재 상태 및 가동 시간 표시\n",
-                inline=False
-            )
-            dm_embed.add_field(
-                name="븜 디버그 mem",
-                value="봇의 현재 메모리 사용량 표시\n",
-                inline=False
-            )
-            dm_embed.add_field(
-                name="븜 디버그 switch",
-                value="봇 디버그 모드 전환 (에러로그가 상세하게 표시됩니다. 기본: OFF)\n",
-                inline=False
-            )
-            dm_embed.add_field(
-                name="븜 디버그 stats",
-                value="상위 10개 가장 많이 실행된 명령어와 수행시간 조회\n",
-                inline=False
-            )
-            dm_embed.add_field(
-                name="븜 디버그 userstats",
-                value="상위 3명 가장 많이 명령어를 호출한 사용자의 통계 조회\n**사용자 멘션 포함 주의!**\n",
-                inline=False
-            )
-            dm_embed.add_field(
-                name="븜 디버그 resetstats",
-                value="봇의 사용자 및 명령어 통계 초기화\n *봇 재시작시 자동 초기화, 메모리 사용량이 높으면 사용*\n",
-                inline=False
-            )
+            dm_embed = discord.Embed.from_dict(_HELP_EMBED_DICTS["관리자_DM"])
         else:
             # 관리자 권한 없음 -> 권한 없음 안내
             embed = discord.Embed(
@@ -384,17 +448,8 @@ async def deb_help(ctx: commands.Context[BumKkiBot], category: str = None):
                 color=discord.Color.red()
             )
 
-    # 공통 푸터
-    embed_footer:str = (
-        "------\n"
-        f"봇 이름: {ctx.guild.me.name}\n"
-        f"봇 버전: {bot_version}\n"
-        f"소스코드: https://github.com/yhbird/study-discord\n"
-        "------\n"
-        "Data based on NEXON Open API\n"
-        "Powered by Neople Open API\n"
-        "주식 데이터 Yahoo Finance 제공\n"
-    )
+    # 공통 푸터 (guild 단위 캐시)
+    embed_footer: str = _help_footer(ctx)
     embed.set_footer(text=embed_footer)
 
     if category == "관리자":
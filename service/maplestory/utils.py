@@ -1,21 +1,25 @@
 from __future__ import annotations
 
 import io
+import sys
 import asyncio
+import bisect
+import functools
 import hashlib
-import random
+import itertools
 import math
 import time
-import json
 import re
 
-from urllib.parse import quote
-from collections import deque
+import orjson
+import aiohttp
+from httpx_aiohttp import AiohttpTransport
+
 from datetime import datetime, timedelta
 from discord import Interaction, ButtonStyle
 from discord.ui import View, Button
 from pytz import timezone
-from PIL import Image, ImageDraw, ImageFont, ImageOps, UnidentifiedImageError
+from PIL import Image, ImageDraw, ImageOps
 
 from service.maplestory.consts import MapleEquipmentViewerConfig, MapleCodiHistoryConfig
 from config import NEXON_API_KEY, NEXON_API_HOME # Nexon Open API
@@ -23,13 +27,14 @@ from config import NEXON_API_RPS_LIMIT, NEXON_CHARACTER_IMAGE_URL # Nexon Open A
 from data.json.fortune_message_table import fortune_message_table_raw
 
 from exceptions.client_exceptions import *
-from common.image import ImageTools, ImageBaseConfig
+from common.image import ImageTools
 from common.time import parse_iso_string
-from common.image import convert_image_url_into_bytes
+from common.image import async_convert_image_url_into_bytes
 
 from typing import Literal, Optional, Dict, List, Tuple, Any
 
 API_MAX_DATE_SEARCH_END: datetime = datetime(year=2023, month=12, day=21) # Nexon API 제공 시작일
+_SEOUL = timezone("Asia/Seoul") # tz 객체는 고정이므로 호출마다 재생성하지 않음
 
 
 class MaplestoryUrls:
@@ -46,48 +51,32 @@ class MaplestoryUrls:
     CHARACTER_IMAGE_URL = NEXON_CHARACTER_IMAGE_URL
 
 
-class CordinateVars:
-    # 이미지 크기 및 설정
-    IMAGE_SIZE : Literal[180] = 180
-    CAPTION_HEIGHT : Literal[28] = 28
-    IMAGES_GRID_COLS : Literal[4] = 4
-    IMAGES_GRID_ROWS : Literal[2] = 2
-    CELL_PADDING_SIZE : Literal[16] = 16
-    BOARD_MARGIN : Literal[24] = 24
-    CELL_RADIUS : Literal[10] = 10
-    BG_COLOR = (255, 255, 255, 255)
-    FG_COLOR = (33, 37, 41, 255)
-    CELL_BG_COLOR = (255, 255, 255, 255)
-    CELL_SHADOW = (0, 0, 0, 40)
-    SHADOW_OFFSET = (0, 2)
-    TITLE_FONT_PATH = "./assets/font/Maplestory_Bold.ttf"
-    CAPTION_FONT_PATH = "./assets/font/Maplestory_Light.ttf"
-    DEFAULT_FONT_PATH = "./assets/font/NanumGothic.ttf"
-    FONT_SIZE : Literal[18] = 18
-    TITLE_FONT_PADDING : Literal[12] = 12
-    PLACE_HOLDER_IMAGE_PATH = "./assets/image/maple_chara_placeholder.png"
+class APIRateLimiter:
+    """호출 간격(period / max_calls) 기반 Rate Limiter
 
+    타임스탬프 deque를 쓸어내는 대신 다음 호출 가능 시각만 유지하므로
+    acquire가 O(1)이고, burst 후 대기가 아닌 균등한 pacing으로 동작
+    """
 
-class APIRateLimiter:
     def __init__(self, max_calls: int = NEXON_API_RPS_LIMIT, period: float = 1.0):
         self.max_calls = max_calls
         self.period = period
-        self.calls = deque()
+        self._interval = period / max_calls
+        self._next_slot: float = 0.0
         self._lock = asyncio.Lock()
 
     async def acquire(self):
-        while True:
-            async with self._lock:
-                now = time.monotonic()
-                while self.calls and (now - self.calls[0]) >= self.period:
-                    self.calls.popleft()
+        async with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self._interval
+            delay = slot - now
+        if delay > 0:
+            await asyncio.sleep(delay)
 
-                if len(self.calls) < self.max_calls:
-                    self.calls.append(now)
-                    return
-
-                wait = self.period - (now - self.calls[0])
-                await asyncio.sleep(wait)
+    async def acquire_hook(self, request: httpx.Request) -> None:
+        """httpx request event hook 시그니처용 래퍼"""
+        await self.acquire()
 
 
 # 보스 분배금 계산을 위한 Viewer 정의
@@ -133,19 +122,28 @@ _api_rate_limiter: Dict[str, APIRateLimiter] = {
     NEXON_API_KEY : APIRateLimiter(max_calls=NEXON_API_RPS_LIMIT, period=1.0)
 }
 
-async def _rate_limit_request(request: httpx.Request):
-    api_key = request.headers.get("x-nxopen-api-key")
-    limiter = _api_rate_limiter.get(api_key) or APIRateLimiter(max_calls=NEXON_API_RPS_LIMIT, period=1.0)
-    await limiter.acquire()
-
 
 def get_httpx_client() -> httpx.AsyncClient:
     global _httpx_client
     if _httpx_client is None:
+        # aiohttp 기반 transport: keep-alive / DNS 캐시 적용 + 동시 요청 처리 개선
+        aiohttp_transport = AiohttpTransport(
+            client=aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=100,
+                    limit_per_host=32,
+                    ttl_dns_cache=300,
+                )
+            )
+        )
+        # API 키가 클라이언트 기본 헤더로 고정되므로 limiter도 생성 시 1회만 바인딩
+        # (per-request 헤더 조회 + dict 조회 + fallback limiter 생성 제거)
+        limiter = _api_rate_limiter[NEXON_API_KEY]
         _httpx_client = httpx.AsyncClient(
+            transport=aiohttp_transport,
             base_url=f"{NEXON_API_HOME}",
             timeout=httpx.Timeout(10.0, connect=5.0),
-            event_hooks={"request": [_rate_limit_request]},
+            event_hooks={"request": [limiter.acquire_hook]},
             headers={"x-nxopen-api-key": NEXON_API_KEY}
         )
     return _httpx_client
@@ -168,25 +166,29 @@ def get_character_image_url(character_image: str) -> str | None:
     return f"{MaplestoryUrls.CHARACTER_IMAGE_URL}{look_value}.png"
 
 
-async def general_request_handler_nexon(request_path: str, headers: Optional[dict] = None) -> dict | None:
-    """Nexon Open API의 일반적인 요청을 처리하는 비동기 함수(v2)  
+async def general_request_handler_nexon(
+        request_path: str,
+        params: Optional[dict] = None,
+        headers: Optional[dict] = None,
+        raw: bool = False
+    ) -> dict | bytes | None:
+    """Nexon Open API의 일반적인 요청을 처리하는 비동기 함수(v2)
 
     API 초당 호출 횟수 제한 (RPS)에 걸리지 않도록 Rate Limiter 적용
 
     Args:
-        request_path (str): 요청할 경로
+        request_path (str): 요청할 경로 (base_url 기준 상대 경로)
+        params (Optional[dict], optional): 쿼리 파라미터. Defaults to None.
         headers (Optional[dict], optional): 요청 헤더. Defaults to None.
+        raw (bool, optional): True면 JSON 파싱 없이 응답 바이트 반환. Defaults to False.
 
     Returns:
-        dict: 응답 데이터
+        dict: 응답 데이터 (raw=True인 경우 bytes)
     """
     client = get_httpx_client()
 
-    request_headers = dict(client.headers)
-    if headers:
-        request_headers.update(headers)
-
-    response = await client.get(request_path, headers=request_headers)
+    # client.headers는 httpx가 요청 시 자동 병합하므로 per-request 복사 불필요
+    response = await client.get(request_path, params=params, headers=headers)
     retry_times = 0
     retry_times_limit = 5
 
@@ -197,22 +199,30 @@ async def general_request_handler_nexon(request_path: str, headers: Optional[dic
         except ValueError:
             wait_time = 1
         await asyncio.sleep(wait_time)
-        response = await client.get(request_path, headers=request_headers)
+        response = await client.get(request_path, params=params, headers=headers)
         retry_times += 1
 
         if retry_times == retry_times_limit:
             raise NexonAPITooManyRequests("Nexon API 요청 초과로 실패했어양...")
 
     if response.status_code == 200:
+        if raw:
+            return response.content
         try:
-            return response.json()
-        except json.JSONDecodeError:
+            # stdlib json 대비 2~5배 빠르고, 불필요한 UTF-8 디코딩 생략
+            return orjson.loads(response.content)
+        except orjson.JSONDecodeError:
             return {"raw": response.text, "status": response.status_code}
 
     nexon_api_error_handler(response)
     return None
 
 
+# 단일 필드만 읽는 소형 응답용 추출 정규식 (이스케이프 포함 문자열은 fallback 처리)
+_OCID_FIELD_RX = re.compile(rb'"ocid"\s*:\s*"([^"\\]+)"')
+_POPULARITY_FIELD_RX = re.compile(rb'"popularity"\s*:\s*(-?\d+)')
+
+
 async def get_ocid(character_name: str) -> str:
     """character_name의 OCID를 비동기적으로 검색
 
@@ -230,14 +240,20 @@ async def get_ocid(character_name: str) -> str:
         (예외처리는 함수 밖에서 처리)
     """
     service_url = MaplestoryUrls.OCID
-    url_encode_name: str = quote(character_name)
-    request_url = f"{NEXON_API_HOME}{service_url}?character_name={url_encode_name}"
     try:
-        response_data: dict = await general_request_handler_nexon(request_url)
+        # URL 인코딩은 httpx가 params 처리 과정에서 수행
+        response_body: bytes = await general_request_handler_nexon(
+            service_url, params={"character_name": character_name}, raw=True
+        )
     except NexonAPIBadRequest as e:
         raise NexonAPICharacterNotFound("Character not found") from e
 
-    # 정상적으로 OCID를 찾았을 때
+    # 응답에서 ocid 필드만 추출 (전체 파싱 생략, 실패 시 정식 파서로 fallback)
+    field_match = _OCID_FIELD_RX.search(response_body)
+    if field_match:
+        return field_match.group(1).decode("utf-8")
+
+    response_data: dict = orjson.loads(response_body)
     ocid: str = str(response_data.get('ocid'))
     if ocid:
         return ocid
@@ -258,9 +274,15 @@ async def get_popularity(ocid: str) -> int | str:
         Exception: 요청 오류에 대한 예외를 발생시킴
     """
     service_url = MaplestoryUrls.POP
-    request_url = f"{NEXON_API_HOME}{service_url}?ocid={ocid}"
     try:
-        response_data: dict = await general_request_handler_nexon(request_url)
+        response_body: bytes = await general_request_handler_nexon(
+            service_url, params={"ocid": ocid}, raw=True
+        )
+        # 응답에서 popularity 필드만 추출 (전체 파싱 생략, 실패 시 정식 파서로 fallback)
+        field_match = _POPULARITY_FIELD_RX.search(response_body)
+        if field_match:
+            return int(field_match.group(1))
+        response_data: dict = orjson.loads(response_body)
         popularity: int | str = response_data.get('popularity', "몰라양")
         return popularity
     except NexonAPIError:
@@ -277,18 +299,27 @@ async def get_ability_info(ocid: str) -> dict:
         dict: 캐릭터의 어빌리티 정보
     """
     service_url = MaplestoryUrls.ABILITY
-    request_url = f"{NEXON_API_HOME}{service_url}?ocid={ocid}"
-    response_data: dict = await general_request_handler_nexon(request_url)
+    response_data: dict = await general_request_handler_nexon(service_url, params={"ocid": ocid})
     return response_data
 
 
 def _compile_patterns():
-    compiled = []
-    for pat, grade_map in ABILITY_MAX_TABLE.items():
-        rx = pat.replace("{n}", r"(?P<value>\d+(?:\,\d+)?)")
-        rx = rf"^\s*(?P<head>{rx})\s*$"
-        compiled.append((re.compile(rx), grade_map))
-    return compiled
+    """어빌리티 패턴 전체를 하나의 정규식 alternation으로 결합
+
+    패턴별로 개별 컴파일하면 어빌리티 1줄당 패턴 수만큼 매칭을 반복하므로,
+    `(?P<p{i}>...)` 형태의 named group으로 묶어 1회 스캔으로 매칭 패턴을 판별
+    (패턴 i의 수치 그룹은 `value{i}`)
+
+    Returns:
+        Tuple[re.Pattern, List[Dict[str, int]]]: 결합 정규식, 패턴 순서별 등급 최대값 목록
+    """
+    parts = []
+    grade_maps = []
+    for i, (pat, grade_map) in enumerate(ABILITY_MAX_TABLE.items()):
+        rx = pat.replace("{n}", rf"(?P<value{i}>\d+(?:\,\d+)?)")
+        parts.append(rf"(?P<p{i}>^\s*{rx}\s*$)")
+        grade_maps.append(grade_map)
+    return re.compile("|".join(parts)), grade_maps
 
 
 # 어빌리티 최대값 테이블 작성
@@ -325,7 +356,28 @@ ABILITY_MAX_TABLE: Dict[str, Dict[str, int]] = {
     r"{n}레벨마다\s마력\s1\s증가": {"레전드리": 10, "유니크": -1, "에픽": -1, "레어": -1}
 }
 
-_COMPILED_PATTERNS = _compile_patterns()
+_ABILITY_COMBINED_RX, _ABILITY_GRADE_MAPS = _compile_patterns()
+
+# 수치 추출용 정규식 (콤마 포함 숫자)
+_ABILITY_NUM_RX = re.compile(r"\d+(?:\,\d+)?")
+
+
+def _build_ability_literal_table() -> Dict[Tuple[str, str], Dict[str, int]]:
+    """(수치 앞 문구, 수치 뒤 문구) -> 등급 최대값 테이블 생성
+
+    ABILITY_MAX_TABLE의 패턴은 `\\s`와 `{n}`을 제외하면 전부 리터럴이므로,
+    수치를 기준으로 앞/뒤 문구를 잘라 dict key로 쓰면 정규식 순회 없이
+    O(1) 조회로 패턴을 분류할 수 있음
+    """
+    table: Dict[Tuple[str, str], Dict[str, int]] = {}
+    for pat, grade_map in ABILITY_MAX_TABLE.items():
+        literal = pat.replace(r"\s", " ")
+        head, _, tail = literal.partition("{n}")
+        table[(head, tail)] = grade_map
+    return table
+
+
+_ABILITY_LITERAL_TABLE = _build_ability_literal_table()
 
 DUAL_ABILITY_MAX_N = {"레전드리": 40, "유니크": 30, "에픽": 20, "레어": 10}
 _DUAL_NUM_RX = re.compile(
@@ -358,9 +410,16 @@ def ability_max_value(
       - 등급='레전더리', 값='메소 획득량 18% 증가'  → '메소 획득량 18(20)% 증가'
       - 등급='레전더리', 값='STR 37 증가, DEX 19 증가' → 'STR 37(40) 증가, DEX 19(20) 증가'
     """
-    ability_grade = ability_grade.strip()
-    ability_text = ability_value.strip()
+    # 캐시 key 정규화를 위해 strip 후 캐시된 구현으로 위임
+    return _ability_max_value_cached(ability_grade.strip(), ability_value.strip(), already_max)
+
 
+@functools.lru_cache(maxsize=4096)
+def _ability_max_value_cached(ability_grade: str, ability_text: str, already_max: bool) -> str:
+    """`ability_max_value`의 캐시된 구현부
+
+    동일 (등급, 어빌리티 문구) 조합이 캐릭터마다 반복되므로 결과를 메모이제이션
+    """
     # 듀얼 어빌리티인 경우
     m2 = _DUAL_NUM_RX.match(ability_text)
     if m2 and ability_grade in DUAL_ABILITY_MAX_N:
@@ -377,44 +436,55 @@ def ability_max_value(
             def need(cur, max):
                 return (cur < max) or (cur == max and not already_max)
 
-            s, e = m2.span(2)
-            out = ability_text
-            if need(cur_value2, max_value2):
-                out = f"{out[:s]}{cur_value2}({max_value2}){out[e:]}"
-
-            m1 = re.search(r"(\d{1,3}(?:,\d{3})*|\d+)", out)
-            if m1 and need(cur_value1, max_value1):
-                s, e = m1.span(1)
-                out = f"{out[:s]}{cur_value1}({max_value1}){out[e:]}"
-
-            return out
+            # 두 수치의 span을 이미 알고 있으므로 한 번에 치환 (재스캔/중간 문자열 생성 제거)
+            s1, e1 = m2.span(1)
+            s2, e2 = m2.span(2)
+            part1 = (
+                f"{cur_value1}({max_value1})"
+                if need(cur_value1, max_value1) else ability_text[s1:e1]
+            )
+            part2 = (
+                f"{cur_value2}({max_value2})"
+                if need(cur_value2, max_value2) else ability_text[s2:e2]
+            )
+            return f"{ability_text[:s1]}{part1}{ability_text[e1:s2]}{part2}{ability_text[e2:]}"
 
     # 듀얼 어빌리티가 아닌 경우
-    for rx, grade_max in _COMPILED_PATTERNS:
-        m = rx.match(ability_text)
-        if not m:
-            continue
+    # 1) 수치 위치만 찾은 뒤 앞/뒤 문구를 key로 O(1) 분류 (정규식 순회 제거)
+    grade_max: Optional[Dict[str, int]] = None
+    m_num = _ABILITY_NUM_RX.search(ability_text)
+    if m_num is not None:
+        start, end = m_num.span()
+        grade_max = _ABILITY_LITERAL_TABLE.get((ability_text[:start], ability_text[end:]))
+
+    # 2) 리터럴 분류 실패 시 결합 정규식으로 fallback
+    if grade_max is None:
+        m = _ABILITY_COMBINED_RX.match(ability_text)
+        if m is None or m.lastindex is None:
+            return ability_text  # 매칭되는 패턴이 없는 경우 그대로 반환
+
+        # 패턴 i의 그룹 번호: p{i} = 2i+1, value{i} = 2i+2
+        pattern_index: int = (m.lastindex - 1) // 2
+        value_group: int = 2 * pattern_index + 2
+        start, end = m.span(value_group)
+        grade_max = _ABILITY_GRADE_MAPS[pattern_index]
+
+    # 현재수치
+    cur_value = ability_text[start:end].replace(",", "")
+    try:
+        cur_value = int(cur_value)
+    except ValueError:
+        return ability_text  # 숫자가 아닌 경우 그대로 반환
 
-        # 현재수치
-        cur_value = m.group("value").replace(",","")
-        try:
-            cur_value = int(cur_value)
-        except ValueError:
-            return ability_text  # 숫자가 아닌 경우 그대로 반환
-        
-        # 최대수치
-        max_value: Optional[int] = grade_max.get(ability_grade)
-        max_value_str: str = str(max_value) if max_value is not None else "오류"
-        if max_value is None:
-            return ability_text
-
-        if (cur_value < max_value) or (cur_value == max_value and not already_max):
-            start, end = m.span("value")
-            return f"{ability_text[:start]}{cur_value}({max_value_str}){ability_text[end:]}"
-        else:
-            return ability_text
-        
-    return ability_text  # 매칭되는 패턴이 없는 경우 그대로 반환
+    # 최대수치
+    max_value: Optional[int] = grade_max.get(ability_grade)
+    if max_value is None:
+        return ability_text
+
+    if (cur_value < max_value) or (cur_value == max_value and not already_max):
+        return f"{ability_text[:start]}{cur_value}({max_value}){ability_text[end:]}"
+    else:
+        return ability_text
 
 
 def ability_info_parse(ability_info: List[Dict]) -> str:
@@ -426,7 +496,7 @@ def ability_info_parse(ability_info: List[Dict]) -> str:
     Returns:
         str: 변환된 어빌리티 정보 문자열
     """
-    result_ability_text = ""
+    result_ability_lines: List[str] = []
     for idx in ability_info:
         ability_grade: str = (
             str(idx.get("ability_grade")).strip()
@@ -441,9 +511,18 @@ def ability_info_parse(ability_info: List[Dict]) -> str:
             ability_value=ability_value
         )
         ability_grade_symbol: str = maple_convert_grade_text(ability_grade)
-        result_ability_text += f"{ability_grade_symbol} {ability_text}\n"
+        result_ability_lines.append(f"{ability_grade_symbol} {ability_text}")
 
-    return result_ability_text.strip() if result_ability_text else "몰라양"
+    return "\n".join(result_ability_lines) if result_ability_lines else "몰라양"
+
+
+# 등급 텍스트 -> 이모티콘 매핑 (호출마다 dict를 새로 만들지 않도록 모듈 레벨에 정의)
+_GRADE_SYMBOL_MAPPING: Dict[str, str] = {
+    "레전드리": "🟩",
+    "유니크": "🟨",
+    "에픽": "🟪",
+    "레어": "🟦",
+}
 
 
 def maple_convert_grade_text(grade_text: str) -> str:
@@ -455,17 +534,37 @@ def maple_convert_grade_text(grade_text: str) -> str:
     Returns:
         str: 변환된 등급 이모티콘
     """
-    lgnd_grade_symbol: str = "🟩"
-    uniq_grade_symbol: str = "🟨"
-    epic_grade_symbol: str = "🟪"
-    rare_grade_symbol: str = "🟦"
-    grade_mapping = {
-        "레전드리": lgnd_grade_symbol,
-        "유니크": uniq_grade_symbol,
-        "에픽": epic_grade_symbol,
-        "레어": rare_grade_symbol,
+    return _GRADE_SYMBOL_MAPPING.get(grade_text, "몰라양")
+
+
+# 공지 필터 축약어 -> 제목 검색 문자열 매핑
+_NOTICE_FILTERS: Dict[str, str] = {
+    "pcbang": "PC방",
+    "sunday": "썬데이",
+}
+
+
+def _extract_notice(notice_data: dict) -> Dict[str, str | Literal["알수없음"]]:
+    """공지사항 1건에서 반환 필드만 추출 (단일/목록 분기 공용 빌더)"""
+    notice_title = notice_data.get("title")
+    notice_url = notice_data.get("url")
+    notice_id = notice_data.get("notice_id")
+    notice_date = notice_data.get("date")
+    notice_start_date = notice_data.get("date_event_start")
+    notice_end_date = notice_data.get("date_event_end")
+    return {
+        "notice_title": str(notice_title).strip() if notice_title is not None else "알수없음",
+        "notice_url": str(notice_url).strip() if notice_url is not None else "알수없음",
+        "notice_id": str(notice_id).strip() if notice_id is not None else "알수없음",
+        # ISO 날짜 문자열은 API에서 공백 없이 내려오므로 strip 생략
+        "notice_date": parse_iso_string(str(notice_date)) if notice_date is not None else "알수없음",
+        "notice_start_date": (
+            parse_iso_string(str(notice_start_date)) if notice_start_date is not None else "알수없음"
+        ),
+        "notice_end_date": (
+            parse_iso_string(str(notice_end_date)) if notice_end_date is not None else "알수없음"
+        ),
     }
-    return grade_mapping.get(grade_text, "몰라양")
 
 
 async def get_notice(target_event: str = None,
@@ -487,20 +586,12 @@ async def get_notice(target_event: str = None,
         https://openapi.nexon.com/ko/game/maplestory/?id=24
     """
     service_url = MaplestoryUrls.NOTICE
-    request_url = f"{NEXON_API_HOME}{service_url}"
-    response_data: dict = await general_request_handler_nexon(request_url)
+    response_data: dict = await general_request_handler_nexon(service_url)
     notices: list = response_data.get('event_notice', [])
-    if target_event is None:
-        notice_filter = None
-    elif target_event == "pcbang":
-        notice_filter = "PC방"
-    elif target_event == "sunday":
-        notice_filter = "썬데이"
-    else:
-        notice_filter = target_event
 
-    # 특정 이벤트에 대한 공지사항 필터링
+    # 특정 이벤트에 대한 공지사항 필터링 (필터가 없으면 리스트 재구성 생략)
     if target_event:
+        notice_filter = _NOTICE_FILTERS.get(target_event, target_event)
         notices = [notice for notice in notices if notice_filter in notice.get('title', '')]
 
     if not notices:
@@ -510,69 +601,10 @@ async def get_notice(target_event: str = None,
             raise NexonAPINoticeNotFound("No notices found")
 
     if recent_notice:
-        notice_data: dict = notices[0]
-
-        return_data: Dict[str, str | Literal["알수없음"]] = {
-            "notice_title" : (
-                str(notice_data.get("title")).strip()
-                if notice_data.get("title") is not None else "알수없음"
-            ),
-            "notice_url" : (
-                str(notice_data.get("url")).strip()
-                if notice_data.get("url") is not None else "알수없음"
-            ),
-            "notice_id" : (
-                str(notice_data.get("notice_id")).strip()
-                if notice_data.get("notice_id") is not None else "알수없음"
-            ),
-            "notice_date" : (
-                parse_iso_string(str(notice_data.get("date")).strip())
-                if notice_data.get("date") is not None else "알수없음"
-            ),
-            "notice_start_date" : (
-                parse_iso_string(str(notice_data.get("date_event_start")).strip())
-                if notice_data.get("date_event_start") is not None else "알수없음"
-            ),
-            "notice_end_date" : (
-                parse_iso_string(str(notice_data.get("date_event_end")).strip())
-                if notice_data.get("date_event_end") is not None else "알수없음"
-            )
-        }
-
-        return return_data
+        # 최신 공지 1건만 필요하므로 나머지 목록은 가공하지 않음
+        return _extract_notice(notices[0])
     else:
-        return_data: List[Dict[str, str | Literal["알수없음"]]] = []
-
-        for notice_data in notices:
-            notice_dict: Dict[str, str | Literal["알수없음"]] = {
-                "notice_title" : (
-                    str(notice_data.get("title")).strip()
-                    if notice_data.get("title") is not None else "알수없음"
-                ),
-                "notice_url" : (
-                    str(notice_data.get("url")).strip()
-                    if notice_data.get("url") is not None else "알수없음"
-                ),
-                "notice_id" : (
-                    str(notice_data.get("notice_id")).strip()
-                    if notice_data.get("notice_id") is not None else "알수없음"
-                ),
-                "notice_date" : (
-                    parse_iso_string(str(notice_data.get("date")).strip())
-                    if notice_data.get("date") is not None else "알수없음"
-                ),
-                "notice_start_date" : (
-                    parse_iso_string(str(notice_data.get("date_event_start")).strip())
-                    if notice_data.get("date_event_start") is not None else "알수없음"
-                ),
-                "notice_end_date" : (
-                    parse_iso_string(str(notice_data.get("date_event_end")).strip())
-                    if notice_data.get("date_event_end") is not None else "알수없음"
-                )
-            }
-            return_data.append(notice_dict)
-
-        return return_data
+        return [_extract_notice(notice_data) for notice_data in notices]
 
 
 async def get_notice_details(notice_id: str) -> dict:
@@ -588,50 +620,76 @@ async def get_notice_details(notice_id: str) -> dict:
         Exception: 요청 오류에 대한 예외를 발생시킴
     """
     service_url = MaplestoryUrls.NOTICE_DETAIL
-    request_url = f"{NEXON_API_HOME}{service_url}?notice_id={notice_id}"
-    response_data: dict = await general_request_handler_nexon(request_url)
+    response_data: dict = await general_request_handler_nexon(service_url, params={"notice_id": notice_id})
     return response_data
 
 
 # 랜덤 시드 기반 메이플스토리 운세 생성 및 경험치 추세 데이터 수집
 def generate_fortune_seed(base_seed: int, f_cate: str, salt: str) -> int:
-    h = hashlib.md5(f"{base_seed}|{f_cate}|{salt}".encode('utf-8')).hexdigest()
-    return int(h, 16)
+    # 모듈러 roll 도출에는 64bit면 충분 - MD5 + 128bit hex 파싱 대비 가볍다
+    h = hashlib.blake2b(f"{base_seed}|{f_cate}|{salt}".encode('utf-8'), digest_size=8).digest()
+    return int.from_bytes(h, "big")
 
 
-def fortune_pick_grade(rng: random.Random, grade_table: List[Tuple[int, int]]) -> int:
-    roll = rng.randint(1, 100)
+def fortune_pick_grade(roll: int, grade_table: List[Tuple[int, int]]) -> int:
+    """1~100 범위의 roll 값으로 가중치 테이블에서 운세 등급을 결정"""
     acc = 0
     for g, w in grade_table:
         acc += w
         if roll <= acc:
             return g
     return -1
+
+
+# 운세 등급 가중치는 고정이므로 roll(1~100) -> 등급 LUT를 모듈 로드 시 생성
+_FORTUNE_GRADE_WEIGHTS: Tuple[Tuple[int, int], ...] = (
+    (5, 5),
+    (4, 20),
+    (3, 30),
+    (2, 40),
+    (1, 5),
+)
+_FORTUNE_GRADE_LUT: Tuple[int, ...] = tuple(
+    fortune_pick_grade(roll, _FORTUNE_GRADE_WEIGHTS) for roll in range(1, 101)
+)
     
 
-# 운세 메세지 list 생성 (가중치 반영)
-def generate_fortune_messages(
+# 운세 메세지 풀 생성 (가중치 누적합 반영)
+def generate_fortune_message_pool(
         table_name: str,
         msg_table: Dict[str, List[Tuple[str, int]]]
-    ) -> List[str]:
-    """운세 메세지 list 생성 (가중치 반영)
+    ) -> Tuple[Tuple[str, ...], Tuple[int, ...]]:
+    """운세 메세지 풀 생성 (가중치 누적합 반영)
+
+    `[msg] * weight` 전개 대신 (메세지, 가중치 누적합) 튜플을 만들어
+    모듈러 roll + bisect로 동일 분포를 추출
+    (메모리 사용량이 가중치 합이 아닌 메세지 수에 비례)
 
     Args:
         table_name (str): 운세 메세지 테이블 Key 이름 (예: "StarForce_lv5")
         msg_table (Dict[str, List[Tuple[str, int]]]): 운세 메세지 테이블
 
     Returns:
-        List[str]: 가중치가 반영된 운세 메세지 리스트
+        Tuple[Tuple[str, ...], Tuple[int, ...]]: (메세지 목록, 가중치 누적합)
     """
-    fortune_msg_table = msg_table.get(table_name, {})
-    return_msgs = []
+    fortune_msg_table = msg_table.get(table_name, [])
     if not fortune_msg_table:
-        return []
-    else:
-        for msg, weight in fortune_msg_table:
-            return_msgs.extend([msg] * weight)
-    return return_msgs
-    
+        return (), ()
+    messages = tuple(msg for msg, _ in fortune_msg_table)
+    cum_weights = tuple(itertools.accumulate(weight for _, weight in fortune_msg_table))
+    return messages, cum_weights
+
+
+# 운세 메세지 테이블은 정적이므로 모듈 로드 시 1회만 전개 (카테고리 x 등급)
+_FORTUNE_CATEGORIES: Tuple[str, ...] = ("StarForce", "Cube", "Boss", "Cash", "Hunter")
+_FORTUNE_MSG_BY_CATE_GRADE: Dict[str, Dict[int, Tuple[Tuple[str, ...], Tuple[int, ...]]]] = {
+    f_cate: {
+        grade: generate_fortune_message_pool(f"{f_cate}_lv{grade}", fortune_message_table_raw)
+        for grade in range(1, 6)
+    }
+    for f_cate in _FORTUNE_CATEGORIES
+}
+
 
 def maple_pick_fortune(seed: int) -> str:
     """메이플스토리 운세를 생성하는 함수
@@ -649,13 +707,6 @@ def maple_pick_fortune(seed: int) -> str:
         2: ("★★☆☆☆", "주의"),
         1: ("★☆☆☆☆", "폭망💥"),
     }
-    fortune_grade_weights: List[Tuple[int, int]] = [
-        (5, 5),
-        (4, 20),
-        (3, 30),
-        (2, 40),
-        (1, 5),
-    ]
     fortune_category: Dict[str, str] = {
         "StarForce": "오늘의 스타포스 운세",
         "Cube": "오늘의 큐브 운세",
@@ -664,72 +715,19 @@ def maple_pick_fortune(seed: int) -> str:
         "Hunter": "오늘의 사냥 운세",
     }
 
-    fortune_message_table: Dict[str, List[Tuple[str, int]]] = fortune_message_table_raw
-
-    # 운세 메세지 list 생성 (가중치 반영)
-    def _generate_fortune_messages(table_name: str) -> List[str]:
-        msg_table = fortune_message_table.get(table_name, {})
-        return_msgs = []
-        if not msg_table:
-            return []
-        else:
-            for msg, weight in msg_table:
-                return_msgs.extend([msg] * weight)
-        return return_msgs
-
-
-    fortune_message : Dict[str, Dict[int, List[str]]] = {
-        "StarForce": {
-            5: _generate_fortune_messages("StarForce_lv5"),
-            4: _generate_fortune_messages("StarForce_lv4"),
-            3: _generate_fortune_messages("StarForce_lv3"),
-            2: _generate_fortune_messages("StarForce_lv2"),
-            1: _generate_fortune_messages("StarForce_lv1"),
-        },
-        "Cube": {
-            5: _generate_fortune_messages("Cube_lv5"),
-            4: _generate_fortune_messages("Cube_lv4"),
-            3: _generate_fortune_messages("Cube_lv3"),
-            2: _generate_fortune_messages("Cube_lv2"),
-            1: _generate_fortune_messages("Cube_lv1"),
-        },
-        "Boss": {
-            5: _generate_fortune_messages("Boss_lv5"),
-            4: _generate_fortune_messages("Boss_lv4"),
-            3: _generate_fortune_messages("Boss_lv3"),
-            2: _generate_fortune_messages("Boss_lv2"),
-            1: _generate_fortune_messages("Boss_lv1"),
-        },
-        "Cash": {
-            5: _generate_fortune_messages("Cash_lv5"),
-            4: _generate_fortune_messages("Cash_lv4"),
-            3: _generate_fortune_messages("Cash_lv3"),
-            2: _generate_fortune_messages("Cash_lv2"),
-            1: _generate_fortune_messages("Cash_lv1"),
-        },
-        "Hunter": {
-            5: _generate_fortune_messages("Hunter_lv5"),
-            4: _generate_fortune_messages("Hunter_lv4"),
-            3: _generate_fortune_messages("Hunter_lv3"),
-            2: _generate_fortune_messages("Hunter_lv2"),
-            1: _generate_fortune_messages("Hunter_lv1"),
-        }
-    }
-    
     fortune_result: List[str] = []
     for f_cate, f_name in fortune_category.items():
-        # 행운 등급 결정
+        # 행운 등급 결정 (seed에서 직접 roll 도출 - Random 객체 생성 생략)
         grade_seed: int = generate_fortune_seed(seed, f_cate, "grade")
-        random_grade: random.Random = random.Random(grade_seed)
-        f_grade = fortune_pick_grade(random_grade, fortune_grade_weights)
+        f_grade = _FORTUNE_GRADE_LUT[grade_seed % 100]
 
         if f_grade != -1:
-            # 행운 메세지 결정
+            # 행운 메세지 결정 (가중치 누적합 + 모듈러 roll)
             message_seed: int = generate_fortune_seed(seed, f_cate, "message")
-            random_message: random.Random = random.Random(message_seed)
             f_result_star, f_result_name = fortune_grade_table[f_grade]
-            f_message_dict: Dict[int, List[str]] = fortune_message.get(f_cate)
-            f_message: str = random_message.choice(f_message_dict.get(f_grade, []))
+            f_messages, f_cum_weights = _FORTUNE_MSG_BY_CATE_GRADE[f_cate][f_grade]
+            message_roll: int = (message_seed % f_cum_weights[-1]) + 1
+            f_message: str = f_messages[bisect.bisect_left(f_cum_weights, message_roll)]
             f_text = (
                 f"{f_name}\n"
                 f"{f_result_star} ({f_result_name}): {f_message}\n"
@@ -741,6 +739,24 @@ def maple_pick_fortune(seed: int) -> str:
     return "\n".join(fortune_result)
 
 
+# 같은 날 동시 호출이 많으므로 (기준일, offset) 별 날짜 문자열 목록을 1건 캐시
+_WEEKLY_DATE_CACHE: Dict[Tuple[Any, int], List[str]] = {}
+
+
+def _weekly_date_list(start_date, time_delta: int) -> List[str]:
+    """기준일로부터 7일치 YYYY-MM-DD 문자열 목록 생성 (strftime 대신 f-string)"""
+    cache_key = (start_date, time_delta)
+    cached = _WEEKLY_DATE_CACHE.get(cache_key)
+    if cached is None:
+        cached = [
+            f"{d.year:04d}-{d.month:02d}-{d.day:02d}"
+            for d in (start_date - timedelta(days=time_delta + i) for i in range(7))
+        ]
+        _WEEKLY_DATE_CACHE.clear()
+        _WEEKLY_DATE_CACHE[cache_key] = cached
+    return cached
+
+
 async def get_weekly_xp_history(character_ocid: str, time_delta: int = 2) -> List[Tuple[str, int, str]]:
     """메이플 스토리 캐릭터의 1주일 간 경험치 추세 데이터 수집
     
@@ -760,24 +776,31 @@ async def get_weekly_xp_history(character_ocid: str, time_delta: int = 2) -> Lis
         https://openapi.nexon.com/ko/game/maplestory/?id=14
     """
 
-    start_date = datetime.now(tz=timezone("Asia/Seoul")).date()
-    date_list: List[str] = [
-        (start_date - timedelta(days=time_delta + i)).strftime("%Y-%m-%d") for i in range(7)
-    ]
+    start_date = datetime.now(tz=_SEOUL).date()
+    date_list: List[str] = _weekly_date_list(start_date, time_delta)
     return_data: List[Tuple[str, int, str]] = []
 
-    for param_date in date_list:
-        request_service_url: str = MaplestoryUrls.BASIC_INFO
-        request_url: str = f"{NEXON_API_HOME}{request_service_url}?ocid={character_ocid}&date={param_date}"
-        response_data: dict = await general_request_handler_nexon(request_url)
-        character_level: int = (
-            int(response_data.get("character_level", -1))
-            if response_data.get("character_level") is not None
-            else -1
+    # 7일치 요청을 동시에 실행 (RPS 제한은 APIRateLimiter가 처리)
+    request_service_url: str = MaplestoryUrls.BASIC_INFO
+    request_tasks = [
+        general_request_handler_nexon(
+            request_service_url, params={"ocid": character_ocid, "date": param_date}
         )
+        for param_date in date_list
+    ]
+    response_list = await asyncio.gather(*request_tasks, return_exceptions=True)
+
+    for param_date, response_data in zip(date_list, response_list):
+        if isinstance(response_data, BaseException) or response_data is None:
+            # 해당 날짜 조회 실패 시 기본값으로 채움
+            return_data.append((param_date, -1, "0.000%"))
+            continue
+        character_level_raw = response_data.get("character_level")
+        character_level: int = int(character_level_raw) if character_level_raw is not None else -1
+        character_exp_rate_raw = response_data.get("character_exp_rate")
         character_exp_rate: str = (
-            str(response_data.get("character_exp_rate")).strip()
-            if response_data.get("character_exp_rate") is not None
+            str(character_exp_rate_raw).strip()
+            if character_exp_rate_raw is not None
             else "0.000%"
         )
         return_data.append((param_date, character_level, character_exp_rate))
@@ -808,7 +831,7 @@ async def get_weekly_xp_history_v2(character_ocid: str, search_end: datetime | N
         https://openapi.nexon.com/ko/game/maplestory/?id=14
     """
 
-    kst_now: datetime = datetime.now(tz=timezone("Asia/Seoul"))
+    kst_now: datetime = datetime.now(tz=_SEOUL)
     if kst_now.hour < 6:
         time_offset: int = 2
     else:
@@ -877,22 +900,23 @@ async def get_basic_info(ocid: str, date_param: Optional[str] = None) -> Optiona
     character_ocid: str = ocid
 
     service_url = MaplestoryUrls.BASIC_INFO
+    request_params: dict = {"ocid": character_ocid}
     if date_param is not None and isinstance(date_param, str):
-        requests_url = f"{NEXON_API_HOME}{service_url}?ocid={character_ocid}&date={date_param}"
-    else:
-        requests_url = f"{NEXON_API_HOME}{service_url}?ocid={character_ocid}"
+        request_params["date"] = date_param
 
-    response_data: dict = await general_request_handler_nexon(requests_url)
+    response_data: dict = await general_request_handler_nexon(service_url, params=request_params)
 
     if isinstance(character_ocid, str):
         return_data: dict = {
             "character_ocid": character_ocid
         }
 
+        # key 별로 .get() 결과를 지역변수에 담아 dict 조회를 1회로 줄임
         # basic info 1. 캐릭터 이름
+        character_name_raw = response_data.get('character_name')
         character_name: str = (
-            str(response_data.get('character_name')).strip()
-            if response_data.get('character_name') is not None
+            str(character_name_raw).strip()
+            if character_name_raw is not None
             else None
         )
 
@@ -900,40 +924,41 @@ async def get_basic_info(ocid: str, date_param: Optional[str] = None) -> Optiona
             return False
         else:
             return_data['character_name'] = character_name
-        
+
         # basic info 2. 캐릭터 레벨
-        character_level: int = (
-            int(response_data.get('character_level'))
-            if response_data.get('character_level') is not None
-            else -1
-        )
+        character_level_raw = response_data.get('character_level')
+        character_level: int = int(character_level_raw) if character_level_raw is not None else -1
         return_data['character_level'] = character_level if character_level != -1 else "몰라양"
 
         # basic info 3. 캐릭터 소속월드
+        character_world_raw = response_data.get('world_name')
         character_world: str | Literal["알수없음"] = (
-            str(response_data.get('world_name')).strip()
-            if response_data.get('world_name') is not None
+            str(character_world_raw).strip()
+            if character_world_raw is not None
             else "알수없음"
         )
         return_data['character_world'] = character_world
 
         # basic info 4. 캐릭터 성별
+        character_gender_raw = response_data.get('character_gender')
         character_gender: str | Literal["기타"] = (
-            str(response_data.get('character_gender')).strip()
-            if response_data.get('character_gender') is not None
+            str(character_gender_raw).strip()
+            if character_gender_raw is not None
             else "기타"
         )
         return_data['character_gender'] = character_gender
 
         # basic info 5. 캐릭터 직업 & 직업차수
+        character_class_raw = response_data.get('character_class')
         character_class: str | Literal["알수없음"] = (
-            str(response_data.get('character_class')).strip()
-            if response_data.get('character_class') is not None
+            str(character_class_raw).strip()
+            if character_class_raw is not None
             else "알수없음"
         )
+        character_class_level_raw = response_data.get('character_class_level')
         character_class_level: str | Literal["알수없음"] = (
-            str(response_data.get('character_class_level')).strip()
-            if response_data.get('character_class_level') is not None
+            str(character_class_level_raw).strip()
+            if character_class_level_raw is not None
             else "알수없음"
         )
         return_data['character_job'] = f"{character_class} ({character_class_level}차 전직)"
@@ -941,14 +966,12 @@ async def get_basic_info(ocid: str, date_param: Optional[str] = None) -> Optiona
         return_data['character_class_level'] = character_class_level
 
         # basic info 6. 캐릭터 경험치 & 퍼센트
-        character_exp: int = (
-            int(response_data.get('character_exp'))
-            if response_data.get('character_exp') is not None
-            else -1
-        )
+        character_exp_raw = response_data.get('character_exp')
+        character_exp: int = int(character_exp_raw) if character_exp_raw is not None else -1
+        character_exp_rate_raw = response_data.get('character_exp_rate')
         character_exp_rate: str | Literal["0.000%"] = (
-            str(response_data.get('character_exp_rate')).strip()
-            if response_data.get('character_exp_rate') is not None
+            str(character_exp_rate_raw).strip()
+            if character_exp_rate_raw is not None
             else "0.000%"
         )
         return_data['character_exp'] = character_exp
@@ -963,25 +986,28 @@ async def get_basic_info(ocid: str, date_param: Optional[str] = None) -> Optiona
         return_data['character_guild_name'] = character_guild_name
 
         # basic info 8. 캐릭터 외형 이미지 URL
+        character_image_raw = response_data.get('character_image')
         character_image: str | Literal[""] = (
-            str(response_data.get('character_image')).strip()
-            if response_data.get('character_image') is not None
+            str(character_image_raw).strip()
+            if character_image_raw is not None
             else ""
         )
         return_data['character_image'] = character_image
 
         # basic info 9. 캐릭터 생성일
+        character_date_create_raw = response_data.get('character_date_create')
         character_date_create: str | Literal["알수없음"] = (
-            str(response_data.get('character_date_create')).strip()
-            if response_data.get('character_date_create') is not None
+            str(character_date_create_raw).strip()
+            if character_date_create_raw is not None
             else "알수없음"
         )
         return_data['character_date_create'] = character_date_create
 
         # basic info 10. 캐릭터 최근 7일 이내 접속 여부 (flag)
+        character_access_flag_raw = response_data.get('character_access_flag')
         character_access_flag: bool | Literal["알수없음"]  = (
-            str(response_data.get('character_access_flag')).strip()
-            if response_data.get('character_access_flag') is not None
+            str(character_access_flag_raw).strip()
+            if character_access_flag_raw is not None
             else "알수없음"
         )
 
@@ -994,9 +1020,10 @@ async def get_basic_info(ocid: str, date_param: Optional[str] = None) -> Optiona
         return_data['character_access_flag'] = character_access_flag
 
         # basic info 11. 캐릭터 해방 퀘스트 완료 여부
+        character_liberation_quest_clear_raw = response_data.get('liberation_quest_clear')
         character_liberation_quest_clear: str | Literal["알수없음"] = (
-            str(response_data.get('liberation_quest_clear')).strip()
-            if response_data.get('liberation_quest_clear') is not None
+            str(character_liberation_quest_clear_raw).strip()
+            if character_liberation_quest_clear_raw is not None
             else "알수없음"
         )
         return_data['liberation_quest_clear'] = character_liberation_quest_clear
@@ -1006,305 +1033,132 @@ async def get_basic_info(ocid: str, date_param: Optional[str] = None) -> Optiona
     return return_data
 
 
-async def get_stat_info(character_ocid: str) -> Optional[Dict[str, Any]] | None:
-    """메이플스토리 캐릭터 상세 정보 데이터를 가공하는 함수
+# 스탯 추출 테이블: (출력 key, Nexon API 스탯명) - 문자열/정수 필드 구분
+# 스탯명은 sys.intern으로 고정해 dict 조회 시 포인터 비교 fast-path를 유도
+_STAT_STR_FIELDS: Tuple[Tuple[str, str], ...] = tuple((out_key, sys.intern(src_key)) for out_key, src_key in (
+    ("stat_attack_min", "최소 스탯공격력"),
+    ("stat_attack_max", "최대 스탯공격력"),
+    ("stat_damage", "데미지"),
+    ("stat_boss_damage", "보스 몬스터 데미지"),
+    ("stat_final_damage", "최종 데미지"),
+    ("stat_ignore_def", "방어율 무시"),
+    ("stat_crit_rate", "크리티컬 확률"),
+    ("stat_crit_damage", "크리티컬 데미지"),
+    ("stat_status_resist", "상태이상 내성"),
+    ("stat_stance", "스탠스"),
+    ("stat_defense", "방어력"),
+    ("stat_move_speed", "이동속도"),
+    ("stat_jump", "점프력"),
+    ("stat_starforce", "스타포스"),
+    ("stat_arcane_force", "아케인포스"),
+    ("stat_authentic_force", "어센틱포스"),
+    ("stat_item_drop", "아이템 드롭률"),
+    ("stat_mesos", "메소 획득량"),
+    ("stat_buff_duration", "버프 지속시간"),
+    ("stat_attack_speed", "공격속도"),
+    ("stat_mob_damage", "일반 몬스터 데미지"),
+    ("stat_cooltime_reduction_sec", "재사용 대기시간 감소 (초)"),
+    ("stat_cooltime_reduction_per", "재사용 대기시간 감소 (%)"),
+    ("stat_cooltime_avoid", "재사용 대기시간 미적용"),
+    ("stat_ignore_element", "속성 내성 무시"),
+    ("stat_status_damage", "상태이상 추가 데미지"),
+    ("stat_weapon_mastery", "무기 숙련도"),
+    ("stat_bonus_exp", "추가 경험치 획득"),
+    ("stat_attack", "공격력"),
+    ("stat_magic", "마력"),
+    ("stat_battle_power", "전투력"),
+    ("stat_familiar_duration", "소환수 지속시간 증가"),
+))
+_STAT_INT_FIELDS: Tuple[Tuple[str, str], ...] = tuple((out_key, sys.intern(src_key)) for out_key, src_key in (
+    ("stat_str", "STR"),
+    ("stat_dex", "DEX"),
+    ("stat_int", "INT"),
+    ("stat_luk", "LUK"),
+    ("stat_hp", "HP"),
+    ("stat_mp", "MP"),
+    ("stat_str_ap", "AP 배분 STR"),
+    ("stat_dex_ap", "AP 배분 DEX"),
+    ("stat_int_ap", "AP 배분 INT"),
+    ("stat_luk_ap", "AP 배분 LUK"),
+    ("stat_hp_ap", "AP 배분 HP"),
+    ("stat_mp_ap", "AP 배분 MP"),
+))
+
+# Nexon API 스탯명 -> (출력 key, 변환 타입) 역방향 매핑 (단일 패스 가공용)
+_STAT_KO_TO_OUT: Dict[str, Tuple[str, type]] = {
+    src_key: (out_key, str) for out_key, src_key in _STAT_STR_FIELDS
+}
+_STAT_KO_TO_OUT.update({src_key: (out_key, int) for out_key, src_key in _STAT_INT_FIELDS})
+
+# 모든 출력 key의 기본값 (응답에 없는 필드 채움용, import 시점에 1회 생성)
+_STAT_DEFAULT: Dict[str, str | int] = {out_key: "알수없음" for out_key, _ in _STAT_STR_FIELDS}
+_STAT_DEFAULT.update({out_key: 0 for out_key, _ in _STAT_INT_FIELDS})
+
+
+def parse_stat_list(stat_list: List[dict]) -> Dict[str, Any]:
+    """스탯 목록(final_stat)을 출력 key 기준 dict로 가공하는 순수 함수
 
     Args:
-        character_ocid (str) : 스탯 데이터를 조회할 캐릭터 OCID
+        stat_list (List[dict]): Nexon API final_stat 목록
 
     Returns:
-        dict: 가공된 캐릭터 상세 정보 데이터
+        Dict[str, Any]: 가공된 캐릭터 상세 정보 데이터
+
+    Raises:
+        NexonAPIError: 스탯 데이터가 비어있거나 인식 가능한 스탯이 없는 경우
     """
-    service_url = MaplestoryUrls.STAT_INFO
-    requests_url = f"{NEXON_API_HOME}{service_url}?ocid={character_ocid}"
-    response_data: dict = await general_request_handler_nexon(requests_url)
-    stat_list: List[dict] = response_data.get('final_stat', [])
-    
-    if isinstance(stat_list, list) and stat_list:
-        character_stat_info: dict = {}
-        for stat in stat_list:
-            stat_name: str = str(stat.get('stat_name')).strip()
-            stat_value: str | None = stat.get('stat_value')
-            if stat_name:
-                character_stat_info[stat_name] = stat_value
-            else:
-                continue
-    else:
+    if not (isinstance(stat_list, list) and stat_list):
         raise NexonAPIError("Invalid stat data format")
-    
-    if character_stat_info != {}:
-        stat_attack_min: str | Literal["알수없음"] = (
-            str(character_stat_info.get("최소 스탯공격력")).strip()
-            if character_stat_info.get("최소 스탯공격력") is not None
-            else "알수없음"
-        )
-        stat_attack_max: str | Literal["알수없음"] = (
-            str(character_stat_info.get("최대 스탯공격력")).strip()
-            if character_stat_info.get("최대 스탯공격력") is not None
-            else "알수없음"
-        )
-        stat_damage: str | Literal["알수없음"] = (
-            str(character_stat_info.get("데미지")).strip()
-            if character_stat_info.get("데미지") is not None
-            else "알수없음"
-        )
-        stat_boss_damage: str | Literal["알수없음"] = (
-            str(character_stat_info.get("보스 몬스터 데미지")).strip()
-            if character_stat_info.get("보스 몬스터 데미지") is not None
-            else "알수없음"
-        )
-        stat_final_damage: str | Literal["알수없음"] = (
-            str(character_stat_info.get("최종 데미지")).strip()
-            if character_stat_info.get("최종 데미지") is not None
-            else "알수없음"
-        )
-        stat_ignore_def: str | Literal["알수없음"] = (
-            str(character_stat_info.get("방어율 무시")).strip()
-            if character_stat_info.get("방어율 무시") is not None
-            else "알수없음"
-        )
-        stat_crit_rate: str | Literal["알수없음"] = (
-            str(character_stat_info.get("크리티컬 확률")).strip()
-            if character_stat_info.get("크리티컬 확률") is not None
-            else "알수없음"
-        )
-        stat_crit_damage: str | Literal["알수없음"] = (
-            str(character_stat_info.get("크리티컬 데미지")).strip()
-            if character_stat_info.get("크리티컬 데미지") is not None
-            else "알수없음"
-        )
-        stat_status_resist: str | Literal["알수없음"] = (
-            str(character_stat_info.get("상태이상 내성")).strip()
-            if character_stat_info.get("상태이상 내성") is not None
-            else "알수없음"
-        )
-        stat_stance: str | Literal["알수없음"] = (
-            str(character_stat_info.get("스탠스")).strip()
-            if character_stat_info.get("스탠스") is not None
-            else "알수없음"
-        )
-        stat_defense: str | Literal["알수없음"] = (
-            str(character_stat_info.get("방어력")).strip()
-            if character_stat_info.get("방어력") is not None
-            else "알수없음"
-        )
-        stat_move_speed: str | Literal["알수없음"] = (
-            str(character_stat_info.get("이동속도")).strip()
-            if character_stat_info.get("이동속도") is not None
-            else "알수없음"
-        )
-        stat_jump: str | Literal["알수없음"] = (
-            str(character_stat_info.get("점프력")).strip()
-            if character_stat_info.get("점프력") is not None
-            else "알수없음"
-        )
-        stat_starforce: str | Literal["알수없음"] = (
-            str(character_stat_info.get("스타포스")).strip()
-            if character_stat_info.get("스타포스") is not None
-            else "알수없음"
-        )
-        stat_arcane_force: str | Literal["알수없음"] = (
-            str(character_stat_info.get("아케인포스")).strip()
-            if character_stat_info.get("아케인포스") is not None
-            else "알수없음"
-        )
-        stat_authentic_force: str | Literal["알수없음"] = (
-            str(character_stat_info.get("어센틱포스")).strip()
-            if character_stat_info.get("어센틱포스") is not None
-            else "알수없음"
-        )
-        stat_str: int = (
-            int(character_stat_info.get("STR"))
-            if character_stat_info.get("STR") is not None
-            else 0
-        )
-        stat_dex: int = (
-            int(character_stat_info.get("DEX"))
-            if character_stat_info.get("DEX") is not None
-            else 0
-        )
-        stat_int: int = (
-            int(character_stat_info.get("INT"))
-            if character_stat_info.get("INT") is not None
-            else 0
-        )
-        stat_luk: int = (
-            int(character_stat_info.get("LUK"))
-            if character_stat_info.get("LUK") is not None
-            else 0
-        )
-        stat_hp: int = (
-            int(character_stat_info.get("HP"))
-            if character_stat_info.get("HP") is not None
-            else 0
-        )
-        stat_mp: int = (
-            int(character_stat_info.get("MP"))
-            if character_stat_info.get("MP") is not None
-            else 0
-        )
-        stat_str_ap: int = (
-            int(character_stat_info.get("AP 배분 STR"))
-            if character_stat_info.get("AP 배분 STR") is not None
-            else 0
-        )
-        stat_dex_ap: int = (
-            int(character_stat_info.get("AP 배분 DEX"))
-            if character_stat_info.get("AP 배분 DEX") is not None
-            else 0
-        )
-        stat_int_ap: int = (
-            int(character_stat_info.get("AP 배분 INT"))
-            if character_stat_info.get("AP 배분 INT") is not None
-            else 0
-        )
-        stat_luk_ap: int = (
-            int(character_stat_info.get("AP 배분 LUK"))
-            if character_stat_info.get("AP 배분 LUK") is not None
-            else 0
-        )
-        stat_hp_ap: int = (
-            int(character_stat_info.get("AP 배분 HP"))
-            if character_stat_info.get("AP 배분 HP") is not None
-            else 0
-        )
-        stat_mp_ap: int = (
-            int(character_stat_info.get("AP 배분 MP"))
-            if character_stat_info.get("AP 배분 MP") is not None
-            else 0
-        )
-        stat_item_drop: str | Literal["알수없음"] = (
-            str(character_stat_info.get("아이템 드롭률")).strip()
-            if character_stat_info.get("아이템 드롭률") is not None
-            else "알수없음"
-        )
-        stat_mesos: str | Literal["알수없음"] = (
-            str(character_stat_info.get("메소 획득량")).strip()
-            if character_stat_info.get("메소 획득량") is not None
-            else "알수없음"
-        )
-        stat_buff_duration: str | Literal["알수없음"] = (
-            str(character_stat_info.get("버프 지속시간")).strip()
-            if character_stat_info.get("버프 지속시간") is not None
-            else "알수없음"
-        )
-        stat_attack_speed: str | Literal["알수없음"] = (
-            str(character_stat_info.get("공격속도")).strip()
-            if character_stat_info.get("공격속도") is not None
-            else "알수없음"
-        )
-        stat_mob_damage: str | Literal["알수없음"] = (
-            str(character_stat_info.get("일반 몬스터 데미지")).strip()
-            if character_stat_info.get("일반 몬스터 데미지") is not None
-            else "알수없음"
-        )
-        stat_cooltime_reduction_sec: str | Literal["알수없음"] = (
-            str(character_stat_info.get("재사용 대기시간 감소 (초)")).strip()
-            if character_stat_info.get("재사용 대기시간 감소 (초)") is not None
-            else "알수없음"
-        )
-        stat_cooltime_reduction_per: str | Literal["알수없음"] = (
-            str(character_stat_info.get("재사용 대기시간 감소 (%)")).strip()
-            if character_stat_info.get("재사용 대기시간 감소 (%)") is not None
-            else "알수없음"
-        )
-        stat_cooltime_avoid: str | Literal["알수없음"] = (
-            str(character_stat_info.get("재사용 대기시간 미적용")).strip()
-            if character_stat_info.get("재사용 대기시간 미적용") is not None
-            else "알수없음"
-        )
-        stat_ignore_element: str | Literal["알수없음"] = (
-            str(character_stat_info.get("속성 내성 무시")).strip()
-            if character_stat_info.get("속성 내성 무시") is not None
-            else "알수없음"
-        )
-        stat_status_damage: str | Literal["알수없음"] = (
-            str(character_stat_info.get("상태이상 추가 데미지")).strip()
-            if character_stat_info.get("상태이상 추가 데미지") is not None
-            else "알수없음"
-        )
-        stat_weapon_mastery: str | Literal["알수없음"] = (
-            str(character_stat_info.get("무기 숙련도")).strip()
-            if character_stat_info.get("무기 숙련도") is not None
-            else "알수없음"
-        )
-        stat_bonus_exp: str | Literal["알수없음"] = (
-            str(character_stat_info.get("추가 경험치 획득")).strip()
-            if character_stat_info.get("추가 경험치 획득") is not None
-            else "알수없음"
-        )
-        stat_attack: str | Literal["알수없음"] = (
-            str(character_stat_info.get("공격력")).strip()
-            if character_stat_info.get("공격력") is not None
-            else "알수없음"
-        )
-        stat_magic: str | Literal["알수없음"] = (
-            str(character_stat_info.get("마력")).strip()
-            if character_stat_info.get("마력") is not None
-            else "알수없음"
-        )
-        stat_battle_power: str | Literal["알수없음"] = (
-            str(character_stat_info.get("전투력")).strip()
-            if character_stat_info.get("전투력") is not None
-            else "알수없음"
-        )
-        stat_familiar_duration: str | Literal["알수없음"] = (
-            str(character_stat_info.get("소환수 지속시간 증가")).strip()
-            if character_stat_info.get("소환수 지속시간 증가") is not None
-            else "알수없음"
-        )
 
-        processed_stat_info: Dict[str, str | int | Literal["알수없음"]] = {
-            "stat_attack_min": stat_attack_min,
-            "stat_attack_max": stat_attack_max,
-            "stat_damage": stat_damage,
-            "stat_boss_damage": stat_boss_damage,
-            "stat_final_damage": stat_final_damage,
-            "stat_ignore_def": stat_ignore_def,
-            "stat_crit_rate": stat_crit_rate,
-            "stat_crit_damage": stat_crit_damage,
-            "stat_status_resist": stat_status_resist,
-            "stat_stance": stat_stance,
-            "stat_defense": stat_defense,
-            "stat_move_speed": stat_move_speed,
-            "stat_jump": stat_jump,
-            "stat_starforce": stat_starforce,
-            "stat_arcane_force": stat_arcane_force,
-            "stat_authentic_force": stat_authentic_force,
-            "stat_str": stat_str,
-            "stat_dex": stat_dex,
-            "stat_int": stat_int,
-            "stat_luk": stat_luk,
-            "stat_hp": stat_hp,
-            "stat_mp": stat_mp,
-            "stat_str_ap": stat_str_ap,
-            "stat_dex_ap": stat_dex_ap,
-            "stat_int_ap": stat_int_ap,
-            "stat_luk_ap": stat_luk_ap,
-            "stat_hp_ap": stat_hp_ap,
-            "stat_mp_ap": stat_mp_ap,
-            "stat_item_drop": stat_item_drop,
-            "stat_mesos": stat_mesos,
-            "stat_buff_duration": stat_buff_duration,
-            "stat_attack_speed": stat_attack_speed,
-            "stat_mob_damage": stat_mob_damage,
-            "stat_cooltime_reduction_sec": stat_cooltime_reduction_sec,
-            "stat_cooltime_reduction_per": stat_cooltime_reduction_per,
-            "stat_cooltime_avoid": stat_cooltime_avoid,
-            "stat_ignore_element": stat_ignore_element,
-            "stat_status_damage": stat_status_damage,
-            "stat_weapon_mastery": stat_weapon_mastery,
-            "stat_bonus_exp": stat_bonus_exp,
-            "stat_attack": stat_attack,
-            "stat_magic": stat_magic,
-            "stat_battle_power": stat_battle_power,
-            "stat_familiar_duration": stat_familiar_duration,
-        }
-        return processed_stat_info
+    # 기본값 템플릿 복사본에 바로 기록 (dict 증분 리사이즈 및 병합용 중간 dict 제거)
+    processed_stat_info: Dict[str, str | int | Literal["알수없음"]] = _STAT_DEFAULT.copy()
+    found_any: bool = False
+    for stat in stat_list:
+        mapping = _STAT_KO_TO_OUT.get(str(stat.get('stat_name')).strip())
+        if mapping is None:
+            continue
+        out_key, conv = mapping
+        stat_value = stat.get('stat_value')
+        if stat_value is not None:
+            processed_stat_info[out_key] = str(stat_value).strip() if conv is str else int(stat_value)
+            found_any = True
 
-    else:
+    if not found_any:
         raise NexonAPIError("Invalid stat data format")
 
+    return processed_stat_info
+
+
+async def parse_stat_info_batch(stat_lists: List[List[dict]]) -> List[Dict[str, Any]]:
+    """여러 캐릭터의 스탯 목록을 워커 스레드에서 병렬로 가공하는 함수
+
+    길드/파티 단위 조회처럼 여러 응답을 한 번에 가공할 때
+    이벤트 루프를 막지 않도록 파싱을 스레드로 넘긴다.
+
+    Args:
+        stat_lists (List[List[dict]]): 캐릭터별 final_stat 목록
+
+    Returns:
+        List[Dict[str, Any]]: 캐릭터별 가공된 상세 정보 데이터 (입력 순서 유지)
+    """
+    return await asyncio.gather(
+        *(asyncio.to_thread(parse_stat_list, stat_list) for stat_list in stat_lists)
+    )
+
+
+async def get_stat_info(character_ocid: str) -> Dict[str, Any]:
+    """메이플스토리 캐릭터 상세 정보 데이터를 가공하는 함수
+
+    Args:
+        character_ocid (str) : 스탯 데이터를 조회할 캐릭터 OCID
+
+    Returns:
+        dict: 가공된 캐릭터 상세 정보 데이터
+    """
+    service_url = MaplestoryUrls.STAT_INFO
+    response_data: dict = await general_request_handler_nexon(service_url, params={"ocid": character_ocid})
+    return parse_stat_list(response_data.get('final_stat', []))
+
 
 def parse_equipment_info() -> None:
     """캐릭터 장착 장비 아이템 정보 파싱 함수
@@ -1336,12 +1190,11 @@ async def get_item_equipment_info(
         https://openapi.nexon.com/ko/game/maplestory/?id=14
     """
     service_url = MaplestoryUrls.ITEM_EQUIPMENT
+    request_params: dict = {"ocid": character_ocid}
     if date_param is not None and isinstance(date_param, str):
-        request_url = f"{NEXON_API_HOME}{service_url}?ocid={character_ocid}&date={date_param}"
-    else:
-        request_url = f"{NEXON_API_HOME}{service_url}?ocid={character_ocid}"
+        request_params["date"] = date_param
 
-    response_data: dict = await general_request_handler_nexon(request_url)
+    response_data: dict = await general_request_handler_nexon(service_url, params=request_params)
 
     # 응답데이터 가공
     """장착 슬롯 별로 장비 데이터 정보 추출
@@ -1405,6 +1258,34 @@ async def get_item_equipment_info(
     return return_data
 
 
+# 외형 모드별 프리셋 응답 key prefix (기본 모드는 cash_item_equipment_preset)
+_LOOK_MODE_PRESET_KEY: Dict[str, str] = {"1": "additional_cash_item_equipment_preset"}
+
+# 장비/뷰티 조회 TTL 캐시 (코디 컬렉션 등에서 같은 파라미터로 반복 조회되는 경우 API 호출 절약)
+_EQUIPMENT_CACHE_TTL: float = 300.0 # 초 단위
+_EQUIPMENT_CACHE_MAXSIZE: int = 4096
+_equipment_cache: Dict[Tuple[Any, ...], Tuple[float, Any]] = {}
+
+
+def _equipment_cache_get(cache_key: Tuple[Any, ...]) -> Optional[Any]:
+    """장비 TTL 캐시 조회 내부 함수 (만료된 항목은 제거 후 None 반환)"""
+    cached = _equipment_cache.get(cache_key)
+    if cached is None:
+        return None
+    expire_at, cached_value = cached
+    if time.monotonic() >= expire_at:
+        _equipment_cache.pop(cache_key, None)
+        return None
+    return cached_value
+
+
+def _equipment_cache_set(cache_key: Tuple[Any, ...], value: Any) -> None:
+    """장비 TTL 캐시 저장 내부 함수 (최대 크기 초과시 전체 비움)"""
+    if len(_equipment_cache) >= _EQUIPMENT_CACHE_MAXSIZE:
+        _equipment_cache.clear()
+    _equipment_cache[cache_key] = (time.monotonic() + _EQUIPMENT_CACHE_TTL, value)
+
+
 async def get_cash_equipment_info(
         character_ocid: str,
         date_param: Optional[str] = None,
@@ -1423,12 +1304,17 @@ async def get_cash_equipment_info(
     Reference:
         https://openapi.nexon.com/ko/game/maplestory/?id=14
     """
+    cache_key = ("cash_equipment", character_ocid, date_param, look_mode_pin)
+    cached_data = _equipment_cache_get(cache_key)
+    if cached_data is not None:
+        # 호출부에서 값을 덮어쓰는 경우가 있으므로 얕은 복사본 반환
+        return dict(cached_data)
+
     service_url = MaplestoryUrls.CASH_EQUIPMENT
+    request_params: dict = {"ocid": character_ocid}
     if date_param is not None and isinstance(date_param, str):
-        request_url = f"{NEXON_API_HOME}{service_url}?ocid={character_ocid}&date={date_param}"
-    else:
-        request_url = f"{NEXON_API_HOME}{service_url}?ocid={character_ocid}"
-    response_data: dict = await general_request_handler_nexon(request_url)
+        request_params["date"] = date_param
+    response_data: dict = await general_request_handler_nexon(service_url, params=request_params)
 
     
     return_data = {
@@ -1468,16 +1354,14 @@ async def get_cash_equipment_info(
     if return_data["character_look_mode"] is None:
         return_data["character_look_mode"] = "0"
     preset = return_data.get("current_preset_no") or 1
-    if return_data["character_look_mode"] == "1":
-        # 드레스업 혹은 베타 모드인 경우, additional_preset 사용
-        target_key_name = f"additional_cash_item_equipment_preset"
-    else:
-        target_key_name = f"cash_item_equipment_preset"
+    # 드레스업 혹은 베타 모드("1")인 경우, additional_preset 사용
+    prefix = _LOOK_MODE_PRESET_KEY.get(return_data["character_look_mode"], "cash_item_equipment_preset")
     return_data["equipment_look_list"] = (
-        response_data.get(f"{target_key_name}_{preset}", [])
+        response_data.get(f"{prefix}_{preset}", [])
     )
-    
-    return return_data
+
+    _equipment_cache_set(cache_key, return_data)
+    return dict(return_data)
 
 
 def get_current_beauty_equipment_info(
@@ -1524,49 +1408,30 @@ def get_current_cash_equipment_info(
     Returns:
         Dict[str, Dict[str, str]]: 부위별 장착 캐시 아이템 정보
     """
+    def _parse_cash_item(item: Dict[str, Any]) -> Tuple[str, Dict[str, str]]:
+        """캐시 아이템 1개의 (장착 부위, 가공 정보) 추출 내부 함수"""
+        g = item.get # 아이템별 메서드 조회 1회로 축소
+        return str(g("cash_item_equipment_slot", "알수없음")), {
+            "part_name": g("cash_item_equipment_part", "알수없음"), # 장착 장비 종류
+            "item_name": g("cash_item_name", "알수없음"), # 캐시 아이템 이름
+            "item_icon": g("cash_item_icon", ""), # 캐시 아이템 아이콘 URL
+            "item_label": g("cash_item_label") or "없음",
+            "item_coloring_prism": g("cash_item_coloring_prism") or "없음",
+            "item_gender": g("item_gender") or "공용",
+            "freestyle_flag": g("freestyle_flag") or "0" # 프리스타일 쿠폰 사용 여부
+        }
+
     return_info: Dict[str, Dict[str, str]] = {}
     base_equipment_map: List[Dict[str, Any]] = current_cash_equipment_data.get("equipment_base_list")
     for base in base_equipment_map:
-        part_name: str = base.get("cash_item_equipment_part", "알수없음") # 장착 장비 종류
-        slot_name: str = base.get("cash_item_equipment_slot", "알수없음") # 장착 부위
-        item_name: str = base.get("cash_item_name", "알수없음") # 캐시 아이템 이름
-        item_icon: str = base.get("cash_item_icon", "") # 캐시 아이템 아이콘 URL
-        item_label: str = base.get("cash_item_label") or "없음"
-        item_coloring_prism: str = base.get("cash_item_coloring_prism") or "없음"
-        item_gender: str = base.get("item_gender") or "공용"
-        freestyle_flag: str = base.get("freestyle_flag") or "0" # 프리스타일 쿠폰 사용 여부
-
-        return_info[slot_name] = {
-            "part_name": part_name,
-            "item_name": item_name,
-            "item_icon": item_icon,
-            "item_label": item_label,
-            "item_coloring_prism": item_coloring_prism,
-            "item_gender": item_gender,
-            "freestyle_flag": freestyle_flag
-        }
+        slot_name, item_info = _parse_cash_item(base)
+        return_info[slot_name] = item_info
 
     look_equipment_map: List[Dict[str, Any]] = current_cash_equipment_data.get("equipment_look_list")
     for look in look_equipment_map:
-        part_name: str = look.get("cash_item_equipment_part", "알수없음") # 장착 장비 종류
-        slot_name: str = look.get("cash_item_equipment_slot", "알수없음") # 장착 부위
-        item_name: str = look.get("cash_item_name", "알수없음") # 캐시 아이템 이름
-        item_icon: str = look.get("cash_item_icon", "") # 캐시 아이템 아이콘 URL
-        item_label: str = look.get("cash_item_label") or "없음"
-        item_coloring_prism: str = look.get("cash_item_coloring_prism") or "없음"
-        item_gender: str = look.get("item_gender") or "공용"
-        freestyle_flag: str = look.get("freestyle_flag") or "0" # 프리스타일 쿠폰 사용 여부
-
+        slot_name, item_info = _parse_cash_item(look)
         # 덮어쓰기 처리
-        return_info[slot_name] = {
-            "part_name": part_name,
-            "item_name": item_name,
-            "item_icon": item_icon,
-            "item_label": item_label,
-            "item_coloring_prism": item_coloring_prism,
-            "item_gender": item_gender,
-            "freestyle_flag": freestyle_flag
-        }
+        return_info[slot_name] = item_info
 
     return return_info
 
@@ -1581,14 +1446,19 @@ async def get_beauty_equipment_info(
         ocid (str): 캐릭터 OCID
         param_date (Optional[str]): 조회날짜 (None = 실시간)
     """
+    cache_key = ("beauty_equipment", ocid, param_date)
+    cached_data = _equipment_cache_get(cache_key)
+    if cached_data is not None:
+        return dict(cached_data)
+
     service_url = MaplestoryUrls.BEAUTY_EQUIPMENT
+    request_params: dict = {"ocid": ocid}
     if param_date is not None and isinstance(param_date, str):
-        request_url = f"{NEXON_API_HOME}{service_url}?ocid={ocid}&date={param_date}"
-    else:
-        request_url = f"{NEXON_API_HOME}{service_url}?ocid={ocid}"
-    response_data: dict = await general_request_handler_nexon(request_url)
+        request_params["date"] = param_date
+    response_data: dict = await general_request_handler_nexon(service_url, params=request_params)
 
-    return response_data
+    _equipment_cache_set(cache_key, response_data)
+    return dict(response_data)
 
 
 async def get_cordinate_collections(ocid: str, search_end: datetime | None) -> List[Tuple[str, str]]:
@@ -1604,7 +1474,7 @@ async def get_cordinate_collections(ocid: str, search_end: datetime | None) -> L
     Notes:
         search_end는 자동으로 캐릭터 생성 날짜 or API 서비스 오픈 날짜로 변경
     """
-    kst_now: datetime = datetime.now(tz=timezone("Asia/Seoul"))
+    kst_now: datetime = datetime.now(tz=_SEOUL)
 
     if kst_now.hour < 6:
         time_offset: int = 2
@@ -1629,10 +1499,13 @@ async def get_cordinate_collections(ocid: str, search_end: datetime | None) -> L
     while len(cordinate_collections) < collections_length and search_index_date >= search_end_date:
         index_date: str = search_index_date.strftime("%Y-%m-%d")
 
-        # index_date 기준 캐릭터 장착중인 캐시 아이템 정보 조회 -> 외형 모드 확인
-        cash_equipment_data: dict = await get_cash_equipment_info(ocid, date_param=index_date)
+        # index_date 기준 캐시/뷰티/기본 정보는 서로 독립이므로 동시 조회
+        cash_equipment_data, beauty_equipment_data, basic_info_data = await asyncio.gather(
+            get_cash_equipment_info(ocid, date_param=index_date),
+            get_beauty_equipment_info(ocid, param_date=index_date),
+            get_basic_info(ocid, date_param=index_date),
+        )
         cash_equipment_data["character_look_mode"] = look_mode_pin  # 외형 모드 고정
-        beauty_equipment_data: dict = await get_beauty_equipment_info(ocid, param_date=index_date)
 
         # 캐릭터 외관을 구성하는 정보 가공
         cash_info = get_current_cash_equipment_info(cash_equipment_data)
@@ -1643,8 +1516,7 @@ async def get_cordinate_collections(ocid: str, search_end: datetime | None) -> L
             "beauty_info": beauty_info
         }
 
-        # index_date 기준 캐릭터 기본 정보 조회 -> 이미지 URL 추출
-        basic_info_data: dict = await get_basic_info(ocid, date_param=index_date)
+        # index_date 기준 캐릭터 기본 정보 -> 이미지 URL 추출
         character_image: str = basic_info_data.get("character_image", "")
         character_image_url = get_character_image_url(character_image)
 
@@ -1671,40 +1543,6 @@ async def get_cordinate_collections(ocid: str, search_end: datetime | None) -> L
         return cordinate_collections
 
 
-def _load_font(font_path: Optional[str], size: int) -> ImageFont.FreeTypeFont | ImageFont.ImageFont:
-    try:
-        if font_path:
-            return ImageFont.truetype(font_path, size)
-        else:
-            return ImageFont.truetype(ImageBaseConfig.DEFAULT_FONT_PATH, size)
-    except Exception:
-        return ImageFont.load_default()
-    
-# Image 객체 생성
-def _rounded(im: Image.Image, rad: int) -> Image.Image:
-    if im.mode != "RGBA":
-        im = im.convert("RGBA")
-    w, h = im.size
-    mask = Image.new("L", (w, h), 0)
-    d = ImageDraw.Draw(mask)
-    d.rounded_rectangle([(0, 0), (w, h)], radius=rad, fill=255)
-    return_im = Image.new("RGBA", (w, h))
-    return_im.paste(im, (0, 0), mask)
-    return return_im
-
-async def _fetch_image(client: httpx.AsyncClient, url: str) -> Optional[Image.Image]:
-    try:
-        response = await client.get(url, timeout=10.0)
-        response.raise_for_status()
-        image = Image.open(io.BytesIO(response.content)).convert("RGBA")
-        return image
-    except (httpx.HTTPError, UnidentifiedImageError):
-        return None
-
-def _placeholder() -> Image.Image:
-    return Image.open(CordinateVars.PLACE_HOLDER_IMAGE_PATH).convert("RGBA")
-
-
 async def generate_cordinate_collection_image(collection: List[Tuple[str, str]], title: str) -> io.BytesIO:
     """캐릭터의 코디 목록 이미지 생성
 
@@ -1783,8 +1621,8 @@ async def generate_cordinate_collection_image(collection: List[Tuple[str, str]],
                                radius=MapleCodiHistoryConfig.CELL_RADIUS,
                                fill=MapleCodiHistoryConfig.CELL_BG_COLOR)
 
-        # 이미지 렌더링
-        im_bytes: io.BytesIO = convert_image_url_into_bytes(url)
+        # 이미지 렌더링 (동기 fetch는 이벤트 루프를 블로킹하므로 비동기 버전 사용)
+        im_bytes: io.BytesIO = await async_convert_image_url_into_bytes(url)
         im = Image.open(im_bytes).convert("RGBA")
         thumb = ImageOps.fit(image=im,
                              size=(MapleCodiHistoryConfig.IMAGE_SIZE, MapleCodiHistoryConfig.IMAGE_SIZE),
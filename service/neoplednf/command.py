@@ -7,9 +7,182 @@ from bot import BumKkiBot
 from service.neoplednf.utils import *
 from exceptions.command_exceptions import CommandFailure
 
-from bot_logger import log_command, with_timeout
-from common.time import kst_format_now
+from bot_logger import logger, log_command, with_timeout
 from config import COMMAND_TIMEOUT
+from typing import NoReturn
+from collections import Counter
+from itertools import count
+
+
+# 네오플 API 예외 타입별 (사용자 안내 메세지, CommandFailure 사유) 매핑 테이블
+# 세 명령어가 복제하던 except 사다리를 단일 dict 순회로 통합
+# 구체적인 타입을 먼저 검사해야 하므로 NeopleAPIError(베이스)는 마지막에 위치
+_DNF_ERROR_MAP: Dict[type, Tuple[str, str]] = {
+    NeopleAPIInvalidId: ("네오플 API 요청에 오류가 발생했어양!!!", "Invalid ID"),
+    NeopleAPILimitExceed: ("네오플 API 요청 제한에 걸렸어양...", "API limit exceeded"),
+    NeopleAPIInvalidParams: ("네오플 API 요청 파라미터가 잘못되었어양...", "Invalid parameters"),
+    NeopleDNFInvalidServerID: ("서버명이 잘못 입력 되었어양...", "Invalid server name"),
+    NeopleDNFInvalidCharacterInfo: ("캐릭터 '{character_name}'을(를) 찾을 수 없어양...", "Character '{character_name}' not found"),
+    NeopleDNFInvalidRequestParams: ("네오플 API 요청 파라미터에 오류가 발생했어양!!!", "Invalid request parameters"),
+    NeopleDNFSystemMaintenance: ("현재 던전앤파이터 서비스 점검 중이에양!", "System maintenance"),
+    NeopleDNFSystemError: ("던전앤파이터 API에서 오류가 발생했어양!", "System error"),
+    DNFCIDNotFound: ("{server_name}서버 '{character_name}'의 고유ID를 찾을 수 없어양...", "Character ID not found"),
+    DNFCharacterNotFound: ("{server_name}서버 '{character_name}'을(를) 찾을 수 없어양...", "Character '{character_name}' not found"),
+    NeopleAPIError: ("네오플 API 요청에 오류가 발생했어양!!!", "Neople API error"),
+}
+
+
+# 장비창 표기 슬롯 순서 (호출마다 리스트 재생성 방지)
+_EQUIPMENT_SLOTS: Tuple[str, ...] = (
+    "무기", "칭호",
+    "머리어깨", "상의", "벨트", "하의", "신발",
+    "팔찌", "목걸이", "반지",
+    "보조장비", "귀걸이", "마법석",
+)
+
+# '고유 - ' 장비 등급별 세트 포인트 가산치
+_PLUS_SETPOINT_BY_RARITY: Dict[str, int] = {
+    "유니크": 115,
+    "레전더리": 165,
+    "에픽": 215,
+}
+
+# 주간 타임라인에서 클리어 여부를 추적하는 레이드/레기온 이름
+_TRACKED_RAID_NAMES: Tuple[str, ...] = ("디레지에 레이드", "이내 황혼전", "만들어진 신 나벨", "아스라한")
+
+# 아이템 획득 타임라인 코드별 (하이라이트 접두어, 출처 설명 템플릿) 매핑
+# 출처 설명은 str.format으로 dungeon_name/timeline_date를 치환
+_ACQUISITION_HIGHLIGHTS: Dict[int, Tuple[str, str]] = {
+    dnf_timeline_codes.reward_clear_dungeon_card: ("아이템 획득", " ({dungeon_name} 카드보상, {timeline_date})"),
+    dnf_timeline_codes.reward_clear_raid_card: ("아이템 획득", " (레이드 카드 보상, {timeline_date})"),
+    dnf_timeline_codes.reward_promise_card: ("아이템 획득", " (레이드 카드 보상, {timeline_date})"),
+    dnf_timeline_codes.reward_oath_card: ("서약 획득", " (레이드 카드 보상, {timeline_date})"),
+    dnf_timeline_codes.reward_pot_and_box: ("아이템 획득", " (항아리&상자 개봉, {timeline_date})"),
+    dnf_timeline_codes.reward_promise_pot_and_box: ("서약 획득", " (항아리&상자 개봉, {timeline_date})"),
+    dnf_timeline_codes.item_scroll: ("아이템 교환", " ({timeline_date})"),
+    dnf_timeline_codes.item_make: ("아이템 제작", " ({timeline_date})"),
+    dnf_timeline_codes.item_transcend: ("아이템 초월", " ({timeline_date})"),
+}
+
+# 아이템 강화/증폭/제련 타임라인 이름에서 찾을 업그레이드 종류
+_UPGRADE_TYPES: Tuple[str, ...] = ("증폭", "강화", "제련")
+
+# 등급별 획득 집계에서 제외할 타임라인 코드 (교환권 획득, 장비 업그레이드)
+_NO_COUNT_TIMELINE_CODES: Tuple[int, ...] = (dnf_timeline_codes.item_scroll, dnf_timeline_codes.upgrade_stone)
+
+# Embed 본문/푸터 템플릿 (호출마다 f-string 조각 조립 대신 format_map 1회 치환)
+_CHAR_EMBED_TMPL: str = (
+    "[🔗 던담 사이트 이동]({dundam_url})\n"
+    "{dfgear_url_desc}"
+    "**모험단:** {adventure_name}\n"
+    "**레벨:** {character_level}\n"
+    "**직업:** {character_job_name}\n"
+    "**전직:** {character_job_grow_name}\n"
+    "**명성:** {character_fame:,}\n"
+    "**길드:** {character_guild}\n"
+)
+_CHAR_EMBED_FOOTER: str = (
+    "캐릭터 선택창에 나갔다 오면 빨리 갱신되양!\n"
+    "powered by Neople API"
+)
+_EQUIPMENT_EMBED_TMPL: str = (
+    "[🔗 던담 사이트 이동]({dundam_url})\n"
+    "**모험단:** {adventure_name}\n"
+    "**레벨:** {character_level}\n"
+    "**직업:** {character_job_name}\n"
+    "**전직:** {character_job_grow_name}\n"
+    "**명성:** {character_fame:,}\n"
+    "\n{msg_content}"
+)
+_EQUIPMENT_EMBED_FOOTER: str = (
+    "시즌 패치 기준: 2025년 10월 2월 (중천)\n"
+    "캐릭터 선택창에 나갔다 오면 빨리 갱신되양!\n"
+    "powered by Neople API"
+)
+_TIMELINE_SUMMARY_TMPL: str = (
+    "모험단명: {adventure_name}\n"
+    "레벨: {level}\n"
+    "직업: {job_name}, {job_grow_name}\n"
+    "명성: {fame:,}\n\n"
+    "**\-\-\- 이번주 장비 획득 \-\-\-**\n"
+    "🟢 태초 획득: {get_primeval_count}개\n"
+    "🟡 에픽 획득: {get_epic_count}개 (장비 업글 {get_epic_up_count}회)\n"
+    "🟠 레전 획득: {get_legendary_count}개\n\n"
+    "**\-\-\- 레이드 및 레기온 클리어 현황 \-\-\-**\n"
+    "디레지에 레이드 클리어: {clear_raid_diregie}\n"
+    "이내 황혼전 클리어: {clear_raid_twilight}\n"
+    "만들어진 신 나벨 클리어: {clear_raid_nabel}\n"
+    "아포칼립스 레기온 클리어: {clear_raid_region}\n"
+    "\n{timeline_highlight_str}"
+)
+_TIMELINE_EMBED_FOOTER: str = (
+    "패치 시즌: 천해천 (2026.04.24)\n"
+    "목요일 오전 6시 이후 집계\n"
+    "잠식 업그레이드는 에픽 획득에 포함되지 않아양\n"
+    "powered by Neople API"
+)
+
+# 첨부파일 이름 유니크용 단조 증가 카운터 (메세지별로 다르기만 하면 되므로 strftime 불필요)
+_attachment_counter = count()
+
+
+# 동일 (명령어, 서버, 캐릭터) 반복 호출용 렌더링 결과 단기 캐시
+# 짧은 시간 안에 같은 캐릭터를 재조회하면 API 호출/이미지 합성 없이 같은 결과를 재전송
+_RENDER_CACHE_TTL: float = 60.0
+_RENDER_CACHE_MAXSIZE: int = 256
+_render_cache: Dict[Tuple[str, str, str], Tuple[float, dict, Optional[bytes], Optional[str]]] = {}
+
+
+def _render_cache_get(cache_key: Tuple[str, str, str]) -> Optional[Tuple[dict, Optional[bytes], Optional[str]]]:
+    """렌더링 캐시 조회 내부 함수 (만료된 항목은 제거 후 None 반환)"""
+    cached = _render_cache.get(cache_key)
+    if cached is None:
+        return None
+    expire_at, embed_dict, file_bytes, filename = cached
+    if time.monotonic() >= expire_at:
+        _render_cache.pop(cache_key, None)
+        return None
+    return embed_dict, file_bytes, filename
+
+
+def _render_cache_set(
+    cache_key: Tuple[str, str, str],
+    embed: discord.Embed,
+    file_bytes: Optional[bytes] = None,
+    filename: Optional[str] = None,
+) -> None:
+    """렌더링 캐시 저장 내부 함수 (최대 크기 초과시 전체 비움)"""
+    if len(_render_cache) >= _RENDER_CACHE_MAXSIZE:
+        _render_cache.clear()
+    _render_cache[cache_key] = (time.monotonic() + _RENDER_CACHE_TTL, embed.to_dict(), file_bytes, filename)
+
+
+async def _send_cached_render(
+    ctx: commands.Context[BumKkiBot],
+    cached_render: Tuple[dict, Optional[bytes], Optional[str]],
+) -> None:
+    """캐시된 렌더링 결과(Embed + 첨부파일)를 그대로 재전송하는 함수"""
+    embed_dict, file_bytes, filename = cached_render
+    embed = discord.Embed.from_dict(embed_dict)
+    if file_bytes is not None:
+        await ctx.send(embed=embed, file=discord.File(io.BytesIO(file_bytes), filename=filename))
+    else:
+        await ctx.send(embed=embed)
+
+
+async def _handle_dnf_error(
+    ctx: commands.Context[BumKkiBot],
+    error: Exception,
+    server_name: str,
+    character_name: str,
+) -> NoReturn:
+    """네오플 API 호출 예외를 안내 메세지 전송 후 CommandFailure로 변환하는 공통 핸들러"""
+    for error_type, (send_msg, failure_reason) in _DNF_ERROR_MAP.items():
+        if isinstance(error, error_type):
+            await ctx.send(send_msg.format(server_name=server_name, character_name=character_name))
+            raise CommandFailure(failure_reason.format(server_name=server_name, character_name=character_name))
+    await ctx.send("던전앤파이터 API 통신 중 알 수 없는 오류가 발생했어양!")
+    raise CommandFailure("Unknown error")
 
 
 @with_timeout(COMMAND_TIMEOUT)
@@ -30,50 +203,25 @@ async def api_dnf_characters(ctx: commands.Context[BumKkiBot], server_name: str,
     """
     if ctx.message.author.bot:
         return
-    
+
+    # 최근에 같은 캐릭터를 조회했으면 캐시된 결과 재전송
+    render_key = ("dnf_characters", server_name.strip(), character_name.strip())
+    cached_render = _render_cache_get(render_key)
+    if cached_render is not None:
+        await _send_cached_render(ctx, cached_render)
+        return
+
     # 캐릭터 고유 ID 조회 -> 캐릭터 정보 조회
     try:
-        server_id, character_id = (
-            await get_dnf_server_id(server_name),
-            await get_dnf_character_id(server_name, character_name)
+        server_id = await get_dnf_server_id(server_name)
+        character_id = await get_dnf_character_id(server_name, character_name)
+        # ID 확보 후 기본 정보/이미지는 서로 독립이므로 병렬 조회
+        character_info, character_image_bytes = await asyncio.gather(
+            get_dnf_character_info(server_id, character_id),
+            get_dnf_character_image(server_id, character_id),
         )
-        character_info: dict = await get_dnf_character_info(server_id, character_id)
-    except NeopleAPIInvalidId as e:
-        await ctx.send(f"네오플 API 요청에 오류가 발생했어양!!!")
-        raise CommandFailure("Invalid ID")
-    except NeopleAPILimitExceed as e:
-        await ctx.send(f"네오플 API 요청 제한에 걸렸어양...")
-        raise CommandFailure("API limit exceeded")
-    except NeopleAPIInvalidParams as e:
-        await ctx.send(f"네오플 API 요청 파라미터가 잘못되었어양...")
-        raise CommandFailure("Invalid parameters")
-    except NeopleDNFInvalidServerID as e:
-        await ctx.send(f"서버명이 잘못 입력 되었어양...")
-        raise CommandFailure("Invalid server name")
-    except NeopleDNFInvalidCharacterInfo as e:
-        await ctx.send(f"캐릭터 '{character_name}'을(를) 찾을 수 없어양...")
-        raise CommandFailure(f"Character '{character_name}' not found")
-    except NeopleDNFInvalidRequestParams as e:
-        await ctx.send(f"네오플 API 요청 파라미터에 오류가 발생했어양!!!")
-        raise CommandFailure("Invalid request parameters")
-    except NeopleDNFSystemMaintenance as e:
-        await ctx.send(f"현재 던전앤파이터 서비스 점검 중이에양!")
-        raise CommandFailure("System maintenance")
-    except NeopleDNFSystemError as e:
-        await ctx.send(f"던전앤파이터 API에서 오류가 발생했어양!")
-        raise CommandFailure("System error")
-    except NeopleAPIError as e:
-        await ctx.send(f"네오플 API 요청에 오류가 발생했어양!!!")
-        raise CommandFailure("Neople API error")
-    except DNFCIDNotFound as e:
-        await ctx.send(f"{server_name}서버 '{character_name}'의 고유ID를 찾을 수 없어양...")
-        raise CommandFailure(f"Character ID not found")
-    except DNFCharacterNotFound as e:
-        await ctx.send(f"{server_name}서버 '{character_name}'을(를) 찾을 수 없어양...")
-        raise CommandFailure(f"Character '{character_name}' not found")
     except Exception as e:
-        await ctx.send(f"던전앤파이터 API 통신 중 알 수 없는 오류가 발생했어양!")
-        raise CommandFailure("Unknown error")
+        await _handle_dnf_error(ctx, e, server_name, character_name)
 
     # 모험단 이름 추출
     adventure_name: str | Literal["몰라양"] = character_info.get("adventure_name")
@@ -99,25 +247,19 @@ async def api_dnf_characters(ctx: commands.Context[BumKkiBot], server_name: str,
     else:
         dfgear_url_desc = f"[🔗 DFGEAR 사이트 이동]({dfgear_url_c})\n"
 
-    embed_description: str = (
-        f"[🔗 던담 사이트 이동]({dundam_url})\n"
-        f"{dfgear_url_desc}"
-        f"**모험단:** {adventure_name}\n"
-        f"**레벨:** {character_level}\n"
-        f"**직업:** {character_job_name}\n"
-        f"**전직:** {character_job_grow_name}\n"
-        f"**명성:** {character_fame:,}\n"
-        f"**길드:** {character_guild}\n"
-    )
-    embed_footer: str = (
-        f"캐릭터 선택창에 나갔다 오면 빨리 갱신되양!\n"
-        f"powered by Neople API"
-    )
-
-    # 캐릭터 이미지 URL추출
-    character_image_bytes: io.BytesIO = await get_dnf_character_image(server_id, character_id)
-    today_date_str: str = datetime.now().strftime("%Y%m%d%H%M")
-    character_image_filename = f"{server_id}_{character_id}_{today_date_str}.png"
+    embed_description: str = _CHAR_EMBED_TMPL.format_map({
+        "dundam_url": dundam_url,
+        "dfgear_url_desc": dfgear_url_desc,
+        "adventure_name": adventure_name,
+        "character_level": character_level,
+        "character_job_name": character_job_name,
+        "character_job_grow_name": character_job_grow_name,
+        "character_fame": character_fame,
+        "character_guild": character_guild,
+    })
+    embed_footer: str = _CHAR_EMBED_FOOTER
+
+    character_image_filename = f"{server_id}_{character_id}_{next(_attachment_counter)}.png"
     buffer = discord.File(character_image_bytes, filename=character_image_filename)
     # Discord Embed 객체 생성
     if character_job_name == "마법사(여)":
@@ -132,9 +274,12 @@ async def api_dnf_characters(ctx: commands.Context[BumKkiBot], server_name: str,
     embed.colour = embed_color
     embed.set_image(url=f"attachment://{character_image_filename}")
 
-    # Discord Embed 전송
-    await ctx.send(embed=embed, file=buffer)
-    buffer.close()
+    # Discord Embed 전송 (전송 실패시에도 이미지 버퍼가 해제되도록 보장)
+    try:
+        _render_cache_set(render_key, embed, character_image_bytes.getvalue(), character_image_filename)
+        await ctx.send(embed=embed, file=buffer)
+    finally:
+        buffer.close()
     return
 
 
@@ -156,55 +301,39 @@ async def api_dnf_equipment(ctx: commands.Context[BumKkiBot], server_name: str,
         - 융합석 장착 정보 포함
         - 세트 옵션 정보 포함
     """
+    # 최근에 같은 캐릭터를 조회했으면 캐시된 결과 재전송
+    render_key = ("dnf_equipment", server_name.strip(), character_name.strip())
+    cached_render = _render_cache_get(render_key)
+    if cached_render is not None:
+        await _send_cached_render(ctx, cached_render)
+        return
+
     # 캐릭터 고유 ID 조회 -> 캐릭터 정보 조회
     character_image = None
+    equipment_info = None
     try:
-        server_id, character_id = (
-            await get_dnf_server_id(server_name),
-            await get_dnf_character_id(server_name, character_name)
+        server_id = await get_dnf_server_id(server_name)
+        character_id = await get_dnf_character_id(server_name, character_name)
+        # ID 확보 후 정보/장비/이미지는 서로 독립이므로 병렬 조회
+        fetch_results = await asyncio.gather(
+            get_dnf_character_info(server_id, character_id),
+            get_dnf_character_equipment(server_id, character_id),
+            get_dnf_character_image(server_id, character_id),
+            return_exceptions=True,
         )
-        character_info = await get_dnf_character_info(server_id, character_id)
-        equipment_info = await get_dnf_character_equipment(server_id, character_id)
-        character_image = await get_dnf_character_image(server_id, character_id)
-    
-    except NeopleAPIInvalidId as e:
-        await ctx.send(f"네오플 API 요청에 오류가 발생했어양!!!")
-        raise CommandFailure("Invalid ID")
-    except NeopleAPILimitExceed as e:
-        await ctx.send(f"네오플 API 요청 제한에 걸렸어양...")
-        raise CommandFailure("API limit exceeded")
-    except NeopleAPIInvalidParams as e:
-        await ctx.send(f"네오플 API 요청 파라미터가 잘못되었어양...")
-        raise CommandFailure("Invalid parameters")
-    except NeopleDNFInvalidServerID as e:
-        await ctx.send(f"서버명이 잘못 입력 되었어양...")
-        raise CommandFailure("Invalid server name")
-    except NeopleDNFInvalidCharacterInfo as e:
-        await ctx.send(f"캐릭터 '{character_name}'을(를) 찾을 수 없어양...")
-        raise CommandFailure(f"Character '{character_name}' not found")
-    except NeopleDNFInvalidRequestParams as e:
-        await ctx.send(f"네오플 API 요청 파라미터에 오류가 발생했어양!!!")
-        raise CommandFailure("Invalid request parameters")
-    except NeopleDNFSystemMaintenance as e:
-        await ctx.send(f"현재 던전앤파이터 서비스 점검 중이에양!")
-        raise CommandFailure("System maintenance")
-    except NeopleDNFSystemError as e:
-        await ctx.send(f"던전앤파이터 API에서 오류가 발생했어양!")
-        raise CommandFailure("System error")
-    except NeopleAPIError as e:
-        await ctx.send(f"네오플 API 요청에 오류가 발생했어양!!!")
-        raise CommandFailure("Neople API error")
-    except DNFCIDNotFound as e:
-        await ctx.send(f"{server_name}서버 '{character_name}'의 고유ID를 찾을 수 없어양...")
-        raise CommandFailure(f"Character ID not found")
-    except DNFCharacterNotFound as e:
-        await ctx.send(f"{server_name}서버 '{character_name}'을(를) 찾을 수 없어양...")
-        raise CommandFailure(f"Character '{character_name}' not found")
+        character_info, equipment_info, character_image = fetch_results
+        for fetch_result in (character_info, equipment_info):
+            if isinstance(fetch_result, BaseException):
+                raise fetch_result
+        if isinstance(character_image, BaseException):
+            # 이미지 조회 실패(CDN 오류 등)는 장비창 조회 자체를 막지 않음 -> 빈 프레임으로 진행
+            logger.warning(f"던파 캐릭터 이미지 조회 실패, 장비창만 표시함: {character_image}")
+            character_image = None
+
     except Exception as e:
-        await ctx.send(f"던전앤파이터 API 통신 중 알 수 없는 오류가 발생했어양!")
-        raise CommandFailure("Unknown error")
+        await _handle_dnf_error(ctx, e, server_name, character_name)
     
-    if locals().get('equipment_info') is None:
+    if equipment_info is None:
         await ctx.send(f"{server_name}서버 '{character_name}'의 장비 정보를 찾을 수 없어양...")
         raise CommandFailure("Equipment data not found")
     
@@ -212,13 +341,6 @@ async def api_dnf_equipment(ctx: commands.Context[BumKkiBot], server_name: str,
         await ctx.send(f"{server_name}서버 '{character_name}'의 장비 정보가 없어양...")
         raise CommandFailure("Equipment data not found")
     
-    slots = [
-        "무기", "칭호",
-        "머리어깨", "상의", "벨트", "하의", "신발",
-        "팔찌", "목걸이", "반지",
-        "보조장비", "귀걸이", "마법석",
-    ]
-
     # 장비 데이터 파싱
     slot_info_text_list = []
     character_set_items = {}  # 세트 아이템 정보 집계용
@@ -227,7 +349,7 @@ async def api_dnf_equipment(ctx: commands.Context[BumKkiBot], server_name: str,
     total_plus_setpoint = 0
     equipment_icon: Dict[str, str] = {}
 
-    for slot in slots:
+    for slot in _EQUIPMENT_SLOTS:
         equipment_data = equipment_info.get(slot)
         if equipment_data is None:
             slot_info_text = f"{slot}: 없음 (비어있음)\n"
@@ -269,14 +391,7 @@ async def api_dnf_equipment(ctx: commands.Context[BumKkiBot], server_name: str,
                 set_info_text = f"\n\t({set_item_name} + {tune_setpoint}pt{fusion_setpoint_text})"
             elif set_item_name == "없음" and "고유 - " in item_name: # 고유장비 특수 처리
                 # 고유 장비를 장착 하고 있는 경우 (가장 높은 세트의 포인트에 합산됨)
-                if item_rare == "유니크":
-                    plus_setpoint = 115
-                elif item_rare == "레전더리":
-                    plus_setpoint = 165
-                elif item_rare == "에픽":
-                    plus_setpoint = 215
-                else:
-                    plus_setpoint = 0
+                plus_setpoint = _PLUS_SETPOINT_BY_RARITY.get(item_rare, 0)
                 set_info_text = f"\n\t(고유 장비 세트 포인트 + {plus_setpoint}pt{fusion_setpoint_text})"
             else:
                 set_info_text = ""
@@ -321,10 +436,15 @@ async def api_dnf_equipment(ctx: commands.Context[BumKkiBot], server_name: str,
     slot_info_text: str = "\n".join(slot_info_text_list)
 
     # Discord Embed 객체 생성
-    # 장비 아이콘 이미지 생성
-    equipment_board_image = build_equipment_board(equipment_icon, character_image)
-    kst_now: str = kst_format_now().strftime("%Y%m%d%H%M")
-    image_file_name: str = f"{server_id}_{character_id}_equipment_{kst_now}.png"
+    # 슬롯 아이콘 병렬 조회 후 장비창 합성 (PIL 합성은 이벤트 루프를 막지 않도록 스레드에서 수행)
+    equipment_icon_bytes = await fetch_equipment_icons(equipment_icon)
+    equipment_board_image = await asyncio.to_thread(
+        build_equipment_board, equipment_icon, character_image, equipment_icon_bytes
+    )
+    if character_image is not None:
+        # 합성이 끝난 캐릭터 이미지 버퍼는 즉시 해제
+        character_image.close()
+    image_file_name: str = f"{server_id}_{character_id}_equipment_{next(_attachment_counter)}.png"
     equipment_board_image_file: discord.File = discord.File(equipment_board_image, filename=image_file_name)
 
     # 모험단 이름 추출
@@ -346,27 +466,28 @@ async def api_dnf_equipment(ctx: commands.Context[BumKkiBot], server_name: str,
     )
 
     embed_title: str = f"{server_name}서버 '{character_name}' 모험가님의 장비 정보에양!"
-    embed_description: str = (
-        f"[🔗 던담 사이트 이동]({dundam_url})\n"
-        f"**모험단:** {adventure_name}\n"
-        f"**레벨:** {character_level}\n"
-        f"**직업:** {character_job_name}\n"
-        f"**전직:** {character_job_grow_name}\n"
-        f"**명성:** {character_fame:,}\n"
-        f"\n{msg_content}"
-    )
-    embed_footer: str = (
-        f"시즌 패치 기준: 2025년 10월 2월 (중천)\n"
-        f"캐릭터 선택창에 나갔다 오면 빨리 갱신되양!\n"
-        f"powered by Neople API"
-    )
+    embed_description: str = _EQUIPMENT_EMBED_TMPL.format_map({
+        "dundam_url": dundam_url,
+        "adventure_name": adventure_name,
+        "character_level": character_level,
+        "character_job_name": character_job_name,
+        "character_job_grow_name": character_job_grow_name,
+        "character_fame": character_fame,
+        "msg_content": msg_content,
+    })
+    embed_footer: str = _EQUIPMENT_EMBED_FOOTER
     embed = discord.Embed(
         title=embed_title,
         description=embed_description,
         color=discord.Color.blue()
     )
     embed.set_footer(text=embed_footer)
-    await ctx.send(file=equipment_board_image_file, embed=embed)
+    # 전송 실패시에도 장비창 이미지 버퍼가 해제되도록 보장
+    try:
+        _render_cache_set(render_key, embed, equipment_board_image.getvalue(), image_file_name)
+        await ctx.send(file=equipment_board_image_file, embed=embed)
+    finally:
+        equipment_board_image_file.close()
     return
 
 
@@ -393,53 +514,30 @@ async def api_dnf_timeline_weekly(ctx: commands.Context[BumKkiBot], server_name:
     """
     if ctx.message.author.bot:
         return
-    
+
+    # 최근에 같은 캐릭터를 조회했으면 캐시된 결과 재전송
+    render_key = ("dnf_timeline_weekly", server_name.strip(), character_name.strip())
+    cached_render = _render_cache_get(render_key)
+    if cached_render is not None:
+        await _send_cached_render(ctx, cached_render)
+        return
+
     # 캐릭터 고유 ID 조회
+    timeline_data = None
     try:
-        server_id, character_id = (
-            await get_dnf_server_id(server_name),
-            await get_dnf_character_id(server_name, character_name)
+        server_id = await get_dnf_server_id(server_name)
+        character_id = await get_dnf_character_id(server_name, character_name)
+        # ID 확보 후 세트장비/타임라인은 서로 독립이므로 병렬 조회
+        set_item_info: Dict[str, Any] | None
+        timeline_data: dict
+        set_item_info, timeline_data = await asyncio.gather(
+            get_dnf_character_set_equipment_info(server_id, character_id),
+            get_dnf_weekly_timeline(server_id, character_id),
         )
-        set_item_info: Dict[str, Any] | None = await get_dnf_character_set_equipment_info(server_id, character_id)
-        timeline_data: dict = await get_dnf_weekly_timeline(server_id, character_id)
-    except NeopleAPIInvalidId as e:
-        await ctx.send(f"네오플 API 요청에 오류가 발생했어양!!!")
-        raise CommandFailure("Invalid ID")
-    except NeopleAPILimitExceed as e:
-        await ctx.send(f"네오플 API 요청 제한에 걸렸어양...")
-        raise CommandFailure("API limit exceeded")
-    except NeopleAPIInvalidParams as e:
-        await ctx.send(f"네오플 API 요청 파라미터가 잘못되었어양...")
-        raise CommandFailure("Invalid parameters")
-    except NeopleDNFInvalidServerID as e:
-        await ctx.send(f"서버명이 잘못 입력 되었어양...")
-        raise CommandFailure("Invalid server name")
-    except NeopleDNFInvalidCharacterInfo as e:
-        await ctx.send(f"캐릭터 '{character_name}'을(를) 찾을 수 없어양...")
-        raise CommandFailure(f"Character '{character_name}' not found")
-    except NeopleDNFInvalidRequestParams as e:
-        await ctx.send(f"네오플 API 요청 파라미터에 오류가 발생했어양!!!")
-        raise CommandFailure("Invalid request parameters")
-    except NeopleDNFSystemMaintenance as e:
-        await ctx.send(f"현재 던전앤파이터 서비스 점검 중이에양!")
-        raise CommandFailure("System maintenance")
-    except NeopleDNFSystemError as e:
-        await ctx.send(f"던전앤파이터 API에서 오류가 발생했어양!")
-        raise CommandFailure("System error")
-    except NeopleAPIError as e:
-        await ctx.send(f"네오플 API 요청에 오류가 발생했어양!!!")
-        raise CommandFailure("Neople API error")
-    except DNFCIDNotFound as e:
-        await ctx.send(f"{server_name}서버 '{character_name}'의 고유ID를 찾을 수 없어양...")
-        raise CommandFailure(f"Character ID not found")
-    except DNFCharacterNotFound as e:
-        await ctx.send(f"{server_name}서버 '{character_name}'을(를) 찾을 수 없어양...")
-        raise CommandFailure(f"Character '{character_name}' not found")
     except Exception as e:
-        await ctx.send(f"던전앤파이터 API 통신 중 알 수 없는 오류가 발생했어양!")
-        raise CommandFailure("Unknown error")
+        await _handle_dnf_error(ctx, e, server_name, character_name)
 
-    if locals().get('timeline_data') is None:
+    if timeline_data is None:
         await ctx.send(f"{server_name}서버 '{character_name}'의 주간 타임라인 데이터를 찾을 수 없어양...")
         raise CommandFailure("Timeline data not found")
     
@@ -462,16 +560,10 @@ async def api_dnf_timeline_weekly(ctx: commands.Context[BumKkiBot], server_name:
 
         # timeline 데이터 생성
         timeline_title: str = f"{server_name}서버 '{character_name}' 모험가님의 이번주 주간던파에양!"
-        timeline_highlight: str = ""
-        get_legendary_count: int = 0
-        get_epic_count: int = 0
+        timeline_highlight_parts: List[str] = [] # 하이라이트 조각 (마지막에 join)
+        rarity_counter: Counter[str] = Counter() # 등급별 획득 개수 집계
         get_epic_up_count: int = 0 # 장비 업그레이드 횟수
-        get_primeval_count: int = 0
-        clear_raid_diregie_flag: bool = False
-        clear_raid_twilight_flag: bool = False
-        clear_raid_nabel_flag: bool = False
-        clear_raid_mu_flag: bool = False
-        clear_raid_region_flag: bool = False
+        raid_clear_dates: Dict[str, str] = {} # 클리어한 레이드/레기온 이름 -> 클리어 시간
 
         # 타임라인 데이터 파싱
         for row in timeline_rows:
@@ -490,128 +582,56 @@ async def api_dnf_timeline_weekly(ctx: commands.Context[BumKkiBot], server_name:
                 # 태초 아이템 획득 시 하이라이트 메시지 생성
                 tl_cond: bool = (item_rare == "태초") or (item_setid == character_set_item_id and item_rare == "에픽")
                 if tl_cond and timeline_code != dnf_timeline_codes.upgrade_stone:
-
-                    # 던전 카드 보상에서 태초 아이템 획득 시 or 세트 아이템 에픽 획득 시
-                    if timeline_code == dnf_timeline_codes.reward_clear_dungeon_card:
+                    # 획득 코드별 하이라이트 메세지 생성 (코드 -> 템플릿 dict 조회)
+                    highlight_entry = _ACQUISITION_HIGHLIGHTS.get(timeline_code)
+                    if highlight_entry is not None:
+                        highlight_label, source_tmpl = highlight_entry
                         dungeon_name: str = timeline_data.get("dungeonName", "몰라양")
-
-                        timeline_highlight += (
-                            f"아이템 획득: {dnf_convert_grade_text(item_rare)}{item_name}"
-                            f" ({dungeon_name} 카드보상, {timeline_date})\n"
-                        )
-
-                    # 레이드 카드 보상에서 태초 아이템 획득 시
-                    elif timeline_code == dnf_timeline_codes.reward_clear_raid_card:
-                        timeline_highlight += (
-                            f"아이템 획득: {dnf_convert_grade_text(item_rare)}{item_name}"
-                            f" (레이드 카드 보상, {timeline_date})\n"
-                        )
-
-                    elif timeline_code == dnf_timeline_codes.reward_promise_card:
-                        timeline_highlight += (
-                            f"아이템 획득: {dnf_convert_grade_text(item_rare)}{item_name}"
-                            f" (레이드 카드 보상, {timeline_date})\n"
-                        )
-
-                    elif timeline_code == dnf_timeline_codes.reward_oath_card:
-                        timeline_highlight += (
-                            f"서약 획득: {dnf_convert_grade_text(item_rare)}{item_name}"
-                            f" (레이드 카드 보상, {timeline_date})\n"
-                        )
-
-                    # 항아리&상자 보상에서 태초 아이템 획득 시
-                    elif timeline_code == dnf_timeline_codes.reward_pot_and_box:
-                        timeline_highlight += (
-                            f"아이템 획득: {dnf_convert_grade_text(item_rare)}{item_name}"
-                            f" (항아리&상자 개봉, {timeline_date})\n"
-                        )
-
-                    elif timeline_code == dnf_timeline_codes.reward_promise_pot_and_box:
-                        timeline_highlight += (
-                            f"서약 획득: {dnf_convert_grade_text(item_rare)}{item_name}"
-                            f" (항아리&상자 개봉, {timeline_date})\n"
-                        )
-
-                    elif timeline_code == dnf_timeline_codes.item_scroll:
-                        timeline_highlight += (
-                            f"아이템 교환: {dnf_convert_grade_text(item_rare)}{item_name} ({timeline_date})\n"
-                        )
-
-                    elif timeline_code == dnf_timeline_codes.item_make:
-                        timeline_highlight += (
-                            f"아이템 제작: {dnf_convert_grade_text(item_rare)}{item_name} ({timeline_date})\n"
+                        source_text: str = source_tmpl.format(
+                            dungeon_name=dungeon_name, timeline_date=timeline_date
                         )
-
-                    elif timeline_code == dnf_timeline_codes.item_transcend:
-                        timeline_highlight += (
-                            f"아이템 초월: {dnf_convert_grade_text(item_rare)}{item_name} ({timeline_date})\n"
+                        timeline_highlight_parts.append(
+                            f"{highlight_label}: {dnf_convert_grade_text(item_rare)}{item_name}{source_text}\n"
                         )
 
                     # 기타 종말의 숭배자 등에서 아이템 획득
                     else:
                         channel_name = timeline_data.get("channelName", "알수없음")
                         channel_no = timeline_data.get("channelNo", "알수없음")
-                        timeline_highlight += (
+                        timeline_highlight_parts.append(
                             f"아이템 획득: {dnf_convert_grade_text(item_rare)}{item_name} @{channel_name} {channel_no}채널"
                             f" ({timeline_date})\n"
                         )
-                    
-                no_count_conditions: bool = (
-                    timeline_code in (dnf_timeline_codes.item_scroll, dnf_timeline_codes.upgrade_stone)
-                )
+
                 # 장비 업그레이드 (에픽 획득 집계 미포함)
                 if timeline_code == dnf_timeline_codes.upgrade_stone:
                     get_epic_up_count += 1
-                    timeline_highlight += (
+                    timeline_highlight_parts.append(
                         f"장비 업글: {dnf_convert_grade_text(item_rare)}{item_name} ({timeline_date})\n"
                     )
-                
-                # 태초 아이템 획득
-                if item_rare == "태초":
-                    get_primeval_count += 0 if no_count_conditions else 1
-
-                # 에픽 아이템 획득
-                if item_rare == "에픽":
-                    get_epic_count += 0 if no_count_conditions else 1
 
-                # 레전더리 아이템 획득
-                if item_rare == "레전더리":
-                    get_legendary_count += 0 if no_count_conditions else 1
+                # 등급별 획득 집계 (교환/장비 업글은 집계 제외)
+                if timeline_code not in _NO_COUNT_TIMELINE_CODES:
+                    rarity_counter[item_rare] += 1
 
             if timeline_code == dnf_timeline_codes.clear_region:
                 # 레기온 클리어
                 region_name: str = timeline_data.get("regionName", "몰라양")
                 if region_name == "아포칼립스":
-                    clear_raid_region_flag = True
-                    clear_raid_region_date = timeline_date
+                    raid_clear_dates[region_name] = timeline_date
 
             if timeline_code == dnf_timeline_codes.clear_raid:
-                # 레이드 클리어
+                # 레이드 클리어 (추적 대상 레이드만 기록)
                 raid_name: str = timeline_data.get("raidName", "몰라양")
-                if raid_name == "이내 황혼전":
-                    clear_raid_twilight_flag = True
-                    clear_raid_twilight_date = timeline_date
-                if raid_name == "만들어진 신 나벨":
-                    clear_raid_nabel_flag = True
-                    clear_raid_nabel_date = timeline_date
-                if raid_name == "아스라한":
-                    clear_raid_mu_flag = True
-                    clear_raid_mu_date = timeline_date
-                if raid_name == "디레지에 레이드":
-                    clear_raid_diregie_flag = True
-                    clear_raid_diregie_date = timeline_date
+                if raid_name in _TRACKED_RAID_NAMES:
+                    raid_clear_dates[raid_name] = timeline_date
 
             # 아이템 증폭
             if timeline_code == dnf_timeline_codes.item_upgrade:
-                if "증폭" in timeline_name:
-                    up_type = "증폭"
-                elif "강화" in timeline_name:
-                    up_type = "강화"
-                elif "제련" in timeline_name:
-                    up_type = "제련"
-                else:
+                up_type = next((t for t in _UPGRADE_TYPES if t in timeline_name), None)
+                if up_type is None:
                     raise Exception("Invalid upgrade type in timeline data")
-                
+
                 up_item_rare: str = timeline_data.get("itemRarity", "몰라양")
                 up_item_name: str = timeline_data.get("itemName", "몰라양")
                 up_item_before: int = timeline_data.get("before", 0)
@@ -627,53 +647,53 @@ async def api_dnf_timeline_weekly(ctx: commands.Context[BumKkiBot], server_name:
 
                 if up_item_before >= 10:
                     # 10강 이상 증폭/강화 시 하이라이트 메시지 생성
-                    timeline_highlight += (
+                    timeline_highlight_parts.append(
                         f"{dnf_convert_grade_text(up_item_rare)} {up_item_name} {up_item_after} {up_type}에 "
                         f"{'성공' if up_item_result else '실패'} 했어양! ({timeline_date})\n"
                     )
                 
                 if up_item_after == 8 and up_type =="제련" and up_item_result:
                     # 8제련 성공 시 하이라이트 메시지 생성
-                    timeline_highlight += (
+                    timeline_highlight_parts.append(
                         f"{dnf_convert_grade_text(up_item_rare)} {up_item_name} 8 제련에 "
                         f"성공 했어양! ({timeline_date})\n"
                     )
 
         # 타임라인 요약 메시지 생성
+        timeline_highlight: str = "".join(timeline_highlight_parts)
         if timeline_highlight != "":
             timeline_highlight_str: str = f"**\-\-\- 주간 하이라이트 \-\-\-**\n{timeline_highlight}\n"
         else:
             timeline_highlight_str: str = ""
 
-        clear_raid_diregie = dnf_get_clear_flag(clear_raid_diregie_flag, locals().get('clear_raid_diregie_date'))
-        clear_raid_twilight = dnf_get_clear_flag(clear_raid_twilight_flag, locals().get('clear_raid_twilight_date'))
-        clear_raid_nabel = dnf_get_clear_flag(clear_raid_nabel_flag, locals().get('clear_raid_nabel_date'))
-        clear_raid_mu = dnf_get_clear_flag(clear_raid_mu_flag, locals().get('clear_raid_mu_date'))
-        clear_raid_region = dnf_get_clear_flag(clear_raid_region_flag, locals().get('clear_raid_region_date'))
-
-        timeline_summary: str = (
-            f"모험단명: {adventure_name}\n"
-            f"레벨: {level}\n"
-            f"직업: {job_name}, {job_grow_name}\n"
-            f"명성: {fame:,}\n\n"
-            f"**\-\-\- 이번주 장비 획득 \-\-\-**\n"
-            f"🟢 태초 획득: {get_primeval_count}개\n"
-            f"🟡 에픽 획득: {get_epic_count}개 (장비 업글 {get_epic_up_count}회)\n"
-            f"🟠 레전 획득: {get_legendary_count}개\n\n"
-            f"**\-\-\- 레이드 및 레기온 클리어 현황 \-\-\-**\n"
-            f"디레지에 레이드 클리어: {clear_raid_diregie}\n"
-            f"이내 황혼전 클리어: {clear_raid_twilight}\n"
-            f"만들어진 신 나벨 클리어: {clear_raid_nabel}\n"
-            f"아포칼립스 레기온 클리어: {clear_raid_region}\n"
-            f"\n{timeline_highlight_str}"
-        )
-
-        timeline_footer: str = (
-            f"패치 시즌: 천해천 (2026.04.24)\n"
-            f"목요일 오전 6시 이후 집계\n"
-            f"잠식 업그레이드는 에픽 획득에 포함되지 않아양\n"
-            f"powered by Neople API"
-        )
+        clear_raid_diregie = dnf_get_clear_flag("디레지에 레이드" in raid_clear_dates, raid_clear_dates.get("디레지에 레이드"))
+        clear_raid_twilight = dnf_get_clear_flag("이내 황혼전" in raid_clear_dates, raid_clear_dates.get("이내 황혼전"))
+        clear_raid_nabel = dnf_get_clear_flag("만들어진 신 나벨" in raid_clear_dates, raid_clear_dates.get("만들어진 신 나벨"))
+        clear_raid_mu = dnf_get_clear_flag("아스라한" in raid_clear_dates, raid_clear_dates.get("아스라한"))
+        clear_raid_region = dnf_get_clear_flag("아포칼립스" in raid_clear_dates, raid_clear_dates.get("아포칼립스"))
+
+        get_primeval_count: int = rarity_counter["태초"]
+        get_epic_count: int = rarity_counter["에픽"]
+        get_legendary_count: int = rarity_counter["레전더리"]
+
+        timeline_summary: str = _TIMELINE_SUMMARY_TMPL.format_map({
+            "adventure_name": adventure_name,
+            "level": level,
+            "job_name": job_name,
+            "job_grow_name": job_grow_name,
+            "fame": fame,
+            "get_primeval_count": get_primeval_count,
+            "get_epic_count": get_epic_count,
+            "get_epic_up_count": get_epic_up_count,
+            "get_legendary_count": get_legendary_count,
+            "clear_raid_diregie": clear_raid_diregie,
+            "clear_raid_twilight": clear_raid_twilight,
+            "clear_raid_nabel": clear_raid_nabel,
+            "clear_raid_region": clear_raid_region,
+            "timeline_highlight_str": timeline_highlight_str,
+        })
+
+        timeline_footer: str = _TIMELINE_EMBED_FOOTER
 
         # Discord Embed 객체 생성
         embed = discord.Embed(
@@ -682,6 +702,7 @@ async def api_dnf_timeline_weekly(ctx: commands.Context[BumKkiBot], server_name:
         )
         embed.set_footer(text=timeline_footer)
         embed.colour = discord.Colour.from_rgb(128, 0, 128)  # purple
+        _render_cache_set(render_key, embed)
         await ctx.send(embed=embed)
         return
 
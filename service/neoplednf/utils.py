@@ -2,8 +2,9 @@ from __future__ import annotations
 
 import io
 import asyncio
+import functools
 import time
-import json
+import orjson
 
 from urllib.parse import quote
 from collections import deque
@@ -15,7 +16,6 @@ from PIL import Image, ImageDraw, ImageOps
 from typing import Optional, Dict, List, Any, Literal, Tuple
 from config import NEOPLE_API_HOME, NEOPLE_API_KEY
 from config import NEOPLE_API_RPS_LIMIT
-# from common.image import convert_image_url_into_bytes
 from exceptions.client_exceptions import *
 
 
@@ -76,6 +76,36 @@ class neople_api_limiter:
                 await asyncio.sleep(wait)
 
 
+# 네오플 API 응답 TTL 캐시 (같은 캐릭터 반복 조회시 API 호출 절약 + rate limit 여유 확보)
+# 외부 Redis 없이 프로세스 내 dict 사용, 엔드포인트별로 TTL을 다르게 적용
+_DNF_CACHE_MAXSIZE: int = 4096
+_DNF_CACHE_TTL_SERVER_ID: float = 86400.0 # 서버 name-code 맵은 사실상 불변
+_DNF_CACHE_TTL_CHARACTER_ID: float = 86400.0 # 캐릭터 고유 ID는 닉변 전까지 유지
+_DNF_CACHE_TTL_CHARACTER_INFO: float = 300.0
+_DNF_CACHE_TTL_CHARACTER_IMAGE: float = 3600.0
+_DNF_CACHE_TTL_EQUIPMENT: float = 300.0
+_dnf_cache: Dict[Tuple[Any, ...], Tuple[float, Any]] = {}
+
+
+def _dnf_cache_get(cache_key: Tuple[Any, ...]) -> Optional[Any]:
+    """네오플 API TTL 캐시 조회 내부 함수 (만료된 항목은 제거 후 None 반환)"""
+    cached = _dnf_cache.get(cache_key)
+    if cached is None:
+        return None
+    expire_at, cached_value = cached
+    if time.monotonic() >= expire_at:
+        _dnf_cache.pop(cache_key, None)
+        return None
+    return cached_value
+
+
+def _dnf_cache_set(cache_key: Tuple[Any, ...], value: Any, ttl: float) -> None:
+    """네오플 API TTL 캐시 저장 내부 함수 (최대 크기 초과시 전체 비움)"""
+    if len(_dnf_cache) >= _DNF_CACHE_MAXSIZE:
+        _dnf_cache.clear()
+    _dnf_cache[cache_key] = (time.monotonic() + ttl, value)
+
+
 _httpx_client: Optional[httpx.AsyncClient] = None
 _api_rate_limiter: Dict[str, neople_api_limiter] = {
     NEOPLE_API_KEY: neople_api_limiter(max_calls=NEOPLE_API_RPS_LIMIT, period=1.0)
@@ -147,8 +177,8 @@ async def general_request_handler_neople(request_path: str, headers: Optional[di
     
     if response.status_code == 200:
         try:
-            return response.json()
-        except json.JSONDecodeError as e:
+            return orjson.loads(response.content)
+        except orjson.JSONDecodeError:
             return {"raw": response.text, "status": response.status_code}
         
     neople_api_error_handler(response)
@@ -166,11 +196,15 @@ async def get_dnf_server_id(server_name: str) -> str:
     Reference:
         https://developers.neople.co.kr/contents/apiDocs/df
     """
+    search_server_name = server_name.strip()
+    cache_key = ("dnf_server_id", search_server_name)
+    cached_data = _dnf_cache_get(cache_key)
+    if cached_data is not None:
+        return cached_data
+
     service_url = neople_service_url.dnf_servers
     request_url = f"{NEOPLE_API_HOME}{service_url}?apikey={NEOPLE_API_KEY}"
     response_data: dict = await general_request_handler_neople(request_url)
-    
-    search_server_name = server_name.strip()
     return_server_id: str = ""
     dnf_server_list: List[dict] = response_data.get("rows", [])
 
@@ -189,6 +223,7 @@ async def get_dnf_server_id(server_name: str) -> str:
     if return_server_id == "":
         raise DNFServerNotFound(f"던파에 {search_server_name} 서버가 없어양")
 
+    _dnf_cache_set(cache_key, return_server_id, _DNF_CACHE_TTL_SERVER_ID)
     return return_server_id
 
 
@@ -206,6 +241,11 @@ async def get_dnf_character_id(server_name: str, character_name: str) -> str:
         NeopleAPIError: API 호출 오류
     """
     server_id = await get_dnf_server_id(server_name)
+    cache_key = ("dnf_character_id", server_id, character_name.strip())
+    cached_data = _dnf_cache_get(cache_key)
+    if cached_data is not None:
+        return cached_data
+
     character_name_encode = quote(character_name.strip())
     service_url = neople_service_url.dnf_character.format(serverId=server_id)
     request_url = f"{NEOPLE_API_HOME}{service_url}?characterName={character_name_encode}&apikey={NEOPLE_API_KEY}"
@@ -215,6 +255,7 @@ async def get_dnf_character_id(server_name: str, character_name: str) -> str:
     if character_info:
         cid: str = character_info.get("characterId", "")
         if cid:
+            _dnf_cache_set(cache_key, cid, _DNF_CACHE_TTL_CHARACTER_ID)
             return cid
         else:
             raise DNFCIDNotFound(f"모험가 정보를 찾는데 실패했어양...")
@@ -235,6 +276,11 @@ async def get_dnf_character_info(sid: str, cid: str) -> Dict[str, Any]:
     Reference:
         https://developers.neople.co.kr/contents/apiDocs/df    
     """
+    cache_key = ("dnf_character_info", sid, cid)
+    cached_data = _dnf_cache_get(cache_key)
+    if cached_data is not None:
+        return dict(cached_data)
+
     service_url = neople_service_url.dnf_character_info.format(
         serverId=sid, characterId=cid
     )
@@ -257,7 +303,8 @@ async def get_dnf_character_info(sid: str, cid: str) -> Dict[str, Any]:
         "guild_name": c_guild_name or "길드가 없어양!",
 
     }
-    return return_data
+    _dnf_cache_set(cache_key, return_data, _DNF_CACHE_TTL_CHARACTER_INFO)
+    return dict(return_data)
 
 async def get_dnf_character_image(sid: str, cid: str) -> io.BytesIO:
     """던전앤파이터 캐릭터의 프로필 이미지 URL 조회
@@ -272,8 +319,15 @@ async def get_dnf_character_image(sid: str, cid: str) -> io.BytesIO:
     Reference:
         https://developers.neople.co.kr/contents/apiDocs/df    
     """
+    cache_key = ("dnf_character_image", sid, cid)
+    cached_data = _dnf_cache_get(cache_key)
+    if cached_data is not None:
+        # 캐시는 raw bytes로 보관하고 호출부마다 새 BytesIO로 감싸서 반환
+        return io.BytesIO(cached_data)
+
     c_image_url = neople_service_url.dnf_character_image.format(sid=sid, cid=cid)
-    image_bytes: io.BytesIO = convert_image_url_into_bytes(c_image_url)
+    image_bytes: io.BytesIO = await fetch_image_bytes(c_image_url)
+    _dnf_cache_set(cache_key, image_bytes.getvalue(), _DNF_CACHE_TTL_CHARACTER_IMAGE)
     return image_bytes
 
 
@@ -509,6 +563,7 @@ def calculate_final_setpoint(stats: Dict[str, int]) -> tuple[str, int]:
     return best_setname, best_setpoint
 
 
+@functools.lru_cache(maxsize=128)
 def check_setpoint_bonus(setpoint: int) -> str:
     """2550pt를 초과한 세트포인트에 70pt 마다 추가 보너스 효과 부여
 
@@ -524,6 +579,26 @@ def check_setpoint_bonus(setpoint: int) -> str:
     return f"{setpoint}pt"
 
 
+async def _get_dnf_equipment_response(sid: str, cid: str) -> dict:
+    """던전앤파이터 캐릭터 장비 엔드포인트 응답 조회 (TTL 캐시 공유)
+
+    장비 정보와 세트장비 정보가 같은 엔드포인트를 사용하므로
+    raw 응답을 캐시해서 두 조회가 API 호출 1회를 공유하도록 함
+    """
+    cache_key = ("dnf_equipment_raw", sid, cid)
+    cached_data = _dnf_cache_get(cache_key)
+    if cached_data is not None:
+        return cached_data
+
+    service_url = neople_service_url.dnf_character_equipment.format(
+        serverId=sid, characterId=cid
+    )
+    request_url = f"{NEOPLE_API_HOME}{service_url}?apikey={NEOPLE_API_KEY}"
+    response_data: dict = await general_request_handler_neople(request_url)
+    _dnf_cache_set(cache_key, response_data, _DNF_CACHE_TTL_EQUIPMENT)
+    return response_data
+
+
 async def get_dnf_character_set_equipment_info(sid: str, cid: str) -> Dict[str, Any] | None:
     """던전앤파이터 캐릭터의 세트장비 정보 조회
     
@@ -540,11 +615,7 @@ async def get_dnf_character_set_equipment_info(sid: str, cid: str) -> Dict[str,
     Usage:
         - 캐릭터의 세트아이템 정보 확인
     """
-    service_url = neople_service_url.dnf_character_equipment.format(
-        serverId=sid, characterId=cid
-    )
-    request_url = f"{NEOPLE_API_HOME}{service_url}?apikey={NEOPLE_API_KEY}"
-    response_data: dict = await general_request_handler_neople(request_url)
+    response_data: dict = await _get_dnf_equipment_response(sid, cid)
 
     # 세트아이템 정보 수집
     set_item_info_raw: List[Dict[str, Any]] = response_data.get("setItemInfo", [])
@@ -570,11 +641,7 @@ async def get_dnf_character_equipment(sid: str, cid: str) -> Dict[str, Dict[str,
         - 캐릭터의 장착 아이템 정보 확인
         - 캐릭터의 세트아이템 정보 확인
     """
-    service_url = neople_service_url.dnf_character_equipment.format(
-        serverId=sid, characterId=cid
-    )
-    request_url = f"{NEOPLE_API_HOME}{service_url}?apikey={NEOPLE_API_KEY}"
-    response_data: dict = await general_request_handler_neople(request_url)
+    response_data: dict = await _get_dnf_equipment_response(sid, cid)
 
     equipment_list: List[Dict[str, Any]] = response_data.get("equipment", [])
     equipment_data = {}
@@ -698,6 +765,21 @@ def dnf_get_clear_flag(flag: bool, clear_date: Optional[str] = None) -> str:
         return "❌ 미완료"
     
 
+# 아이템 등급(한글) -> 둥그라미 이모티콘 매핑
+_GRADE_EMOJI_MAPPING: Dict[str, str] = {
+    "태초" : "🟢",
+    "신화" : "🟢",
+    "에픽" : "🟡",
+    "레전더리" : "🟠",
+    "유니크" : "🔴", # 핑크색
+    "레어" : "🟣", # 보라색
+    "크로니클" : "🔴",
+    "언커먼" : "🔵",
+    "커먼" : "⚪",
+}
+
+
+@functools.lru_cache(maxsize=32)
 def dnf_convert_grade_text(grade: str) -> str:
     """던전앤파이터 아이템 한글 등급을 이모지로 변환
 
@@ -707,18 +789,7 @@ def dnf_convert_grade_text(grade: str) -> str:
     Returns:
         str: 아이템 등급 (둥그라미 이모티콘)
     """
-    grade_mapping: Dict[str, str] = {
-        "태초" : "🟢",
-        "신화" : "🟢",
-        "에픽" : "🟡",
-        "레전더리" : "🟠",
-        "유니크" : "🔴", # 핑크색
-        "레어" : "🟣", # 보라색
-        "크로니클" : "🔴",
-        "언커먼" : "🔵",
-        "커먼" : "⚪",
-    }
-    return grade_mapping.get(grade.lower(), grade)
+    return _GRADE_EMOJI_MAPPING.get(grade.lower(), grade)
 
 
 async def get_set_item_id(item_id: str) -> Optional[str]:
@@ -827,27 +898,106 @@ def _paste_character_image(
     frame_rect.alpha_composite(char, (cx, cy))
     canvas.alpha_composite(frame_rect, (fx, fy))
 
+# 아이템 아이콘 PNG 캐시 (아이콘은 itemId별 불변이므로 TTL 없이 보관)
+_ICON_CACHE_MAXSIZE: int = 2048
+_icon_cache: Dict[str, bytes] = {}
+
+_image_httpx_client: Optional[httpx.AsyncClient] = None
+
+
+def get_image_httpx_client() -> httpx.AsyncClient:
+    """이미지 CDN(img-api)용 공용 httpx 클라이언트 반환
+
+    API 호출용 클라이언트와 달리 rate limit 훅과 apikey 헤더 없이
+    커넥션 풀만 공유함 (이미지 조회가 API 요청 한도를 소모하지 않도록)
+    """
+    global _image_httpx_client
+    if _image_httpx_client is None:
+        _image_httpx_client = httpx.AsyncClient(timeout=httpx.Timeout(10.0, connect=5.0))
+    return _image_httpx_client
+
+
+async def fetch_image_bytes(url: str) -> io.BytesIO:
+    """이미지 URL을 비동기로 받아 BytesIO로 반환하는 함수
+
+    Args:
+        url (str): 이미지 URL
+
+    Returns:
+        io.BytesIO: 이미지 bytes 버퍼
+
+    Raises:
+        httpx.HTTPStatusError: 이미지 응답이 4xx/5xx인 경우
+    """
+    response = await get_image_httpx_client().get(url)
+    response.raise_for_status()
+    return io.BytesIO(response.content)
+
+
+async def fetch_equipment_icons(item_ids: Dict[str, Optional[str]]) -> Dict[str, Optional[bytes]]:
+    """장비 슬롯별 아이템 아이콘 PNG를 병렬로 조회하는 함수
+
+    Args:
+        item_ids (Dict[str, Optional[str]]): 슬롯명 -> 아이템 ID (빈 슬롯은 None)
+
+    Returns:
+        Dict[str, Optional[bytes]]: 슬롯명 -> 아이콘 PNG bytes (조회 실패/빈 슬롯은 None)
+    """
+    fetch_ids = {iid for iid in item_ids.values() if iid is not None and iid not in _icon_cache}
+
+    async def _fetch_icon(item_id: str) -> None:
+        try:
+            response = await get_image_httpx_client().get(get_item_icon_url(item_id))
+            response.raise_for_status()
+        except Exception:
+            return # 실패한 아이콘은 플레이스홀더로 대체됨
+        if len(_icon_cache) >= _ICON_CACHE_MAXSIZE:
+            _icon_cache.clear()
+        _icon_cache[item_id] = response.content
+
+    if fetch_ids:
+        await asyncio.gather(*(_fetch_icon(item_id) for item_id in fetch_ids))
+
+    return {
+        slot_name: _icon_cache.get(item_id) if item_id is not None else None
+        for slot_name, item_id in item_ids.items()
+    }
+
+
+@functools.cache
+def _placeholder_icon_bytes() -> bytes:
+    """빈 슬롯용 플레이스홀더 아이콘 bytes (디스크에서 1회만 로드)"""
+    return EQUIPMENT_PLACEHOLDER_ICON.read_bytes()
+
 def _load_icon_bytes(item_id: Optional[str]) -> io.BytesIO:
-    if item_id is None:
-        return io.BytesIO(EQUIPMENT_PLACEHOLDER_ICON.read_bytes())
-    try:
-        return convert_image_url_into_bytes(get_item_icon_url(item_id))
-    except Exception:
-        return io.BytesIO(EQUIPMENT_PLACEHOLDER_ICON.read_bytes())
+    # 합성 스레드에서는 네트워크 I/O 없이 아이콘 캐시/플레이스홀더만 사용
+    if item_id is not None and item_id in _icon_cache:
+        return io.BytesIO(_icon_cache[item_id])
+    return io.BytesIO(_placeholder_icon_bytes())
 
 def build_equipment_board(
     item_ids: Dict[str, Optional[str]],
     character_image: Optional[io.BytesIO] = None,
+    icon_bytes_map: Optional[Dict[str, Optional[bytes]]] = None,
 ) -> io.BytesIO:
     """던전앤파이터 장비창 이미지 생성
 
     Args:
         item_ids (Dict[str, Optional[str]]): 아이템 ID 맵핑 데이터 (슬롯명: 아이템ID)
         character_image (Optional[io.BytesIO], optional): 캐릭터 이미지. Defaults to None.
+        icon_bytes_map (Optional[Dict[str, Optional[bytes]]], optional):
+            fetch_equipment_icons로 미리 받아둔 슬롯별 아이콘 bytes. Defaults to None.
 
     Returns:
         _type_: _description_
     """
+    def _slot_icon_bytes(slot_name: str) -> io.BytesIO:
+        # 미리 받아둔 아이콘이 있으면 사용, 없으면 기존 동기 경로로 로드
+        prefetched = icon_bytes_map.get(slot_name) if icon_bytes_map else None
+        if prefetched is not None:
+            return io.BytesIO(prefetched)
+        return _load_icon_bytes(item_ids.get(slot_name))
+
     # 좌/우 그리드 칸 고정
     left_grid_colds, left_grid_rows = 2, 4
     right_grid_colds, right_grid_rows = 2, 4
@@ -880,7 +1030,7 @@ def build_equipment_board(
     for slot_name, (c, r) in ARMOR_SLOT_GRID:
         xy = _slot_pixel(left_origin, c, r)
         _draw_slot(draw, canvas, xy)
-        icon_bytes = _load_icon_bytes(item_ids.get(slot_name))
+        icon_bytes = _slot_icon_bytes(slot_name)
         _paste_icon(canvas, icon_bytes, xy)
 
     # ===== 2) 중앙 캐릭터 이미지 =====
@@ -901,10 +1051,11 @@ def build_equipment_board(
     for slot_name, (c, r) in WEAPON_SLOT_GRID:
         xy = _slot_pixel(right_origin, c, r)
         _draw_slot(draw, canvas, xy)
-        icon_bytes = _load_icon_bytes(item_ids.get(slot_name))
+        icon_bytes = _slot_icon_bytes(slot_name)
         _paste_icon(canvas, icon_bytes, xy)
 
     output = io.BytesIO()
-    canvas.save(output, format="PNG")
+    # zlib 압축 레벨을 낮춰 인코딩 속도 우선 (파일이 약간 커지지만 Discord 첨부 한도에는 여유)
+    canvas.save(output, format="PNG", compress_level=1)
     output.seek(0)
     return output  # ctx.send(file=discord.File(output, filename="equip.png"))